@@ -1,12 +1,38 @@
 """Image extraction utilities for articles."""
 
+import re
+import time
+from collections import OrderedDict
+
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+from ..core.http_client import get_client, html_input
+
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_HEAD_END_BYTES_RE = re.compile(rb"</head\s*>", re.IGNORECASE)
+_META_IMAGE_SELECTOR = 'meta[property="og:image"], meta[name="twitter:image"]'
+_ICON_OR_LOGO_RE = re.compile(r"icon|logo|avatar|favicon|sprite|1x1|pixel", re.IGNORECASE)
+
+# Upper bound on bytes read per page; og:image lives in <head> and a body
+# image, if needed, is almost always near the top of the document.
+_MAX_BYTES = 256 * 1024
+_RANGE_HEADERS = {"Range": f"bytes=0-{_MAX_BYTES - 1}"}
+
+# Results of successful lookups by URL, least recently used first. The same
+# articles come up across keywords and scheduled runs, and their images
+# rarely change.
+_IMAGE_CACHE_SIZE = 1024
+_IMAGE_CACHE_TTL = 24 * 60 * 60  # seconds
+_image_cache: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
 
 
 async def extract_og_image(url: str, timeout: int = 10) -> str | None:
     """Extract Open Graph image from a URL.
 
+    Results are cached per URL for a day, so repeated lookups skip the
+    request. Failed requests are not cached.
+
     Args:
         url: The article URL to fetch.
         timeout: Request timeout in seconds.
@@ -14,49 +40,142 @@ async def extract_og_image(url: str, timeout: int = 10) -> str | None:
     Returns:
         The og:image URL if found, None otherwise.
     """
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    )
-                },
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # Try og:image first (most common)
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            return og_image["content"]
-
-        # Try twitter:image
-        twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
-        if twitter_image and twitter_image.get("content"):
-            return twitter_image["content"]
-
-        # Try first large image in article
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src")
-            if src and not _is_icon_or_logo(src):
-                return src
-
-        return None
+    now = time.monotonic()
+    cached = _image_cache.get(url)
+    if cached is not None and now - cached[0] < _IMAGE_CACHE_TTL:
+        _image_cache.move_to_end(url)
+        return cached[1]
 
+    try:
+        image = await _fetch_og_image(url, timeout)
     except Exception:
         return None
 
+    _image_cache[url] = (now, image)
+    _image_cache.move_to_end(url)
+    if len(_image_cache) > _IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
+    return image
+
+
+def clear_image_cache() -> None:
+    """Forget all cached og:image lookups."""
+    _image_cache.clear()
+
+
+async def _fetch_og_image(url: str, timeout: int) -> str | None:
+    """Fetch a page and find its representative image.
+
+    The page is streamed and the download is aborted as soon as <head> is
+    complete and contains an image meta tag, so most pages only transfer
+    their first few kilobytes.
+
+    Args:
+        url: The article URL to fetch.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        The image URL if found, None otherwise.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status.
+    """
+    client = await get_client()
+    # Servers that ignore Range send the full body; _MAX_BYTES still
+    # caps how much of it is read.
+    async with client.stream(
+        "GET",
+        url,
+        headers=_RANGE_HEADERS,
+        timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+        charset = response.charset_encoding
+        buf = bytearray()
+        head_checked = False
+
+        try:
+            async for chunk in response.aiter_bytes():
+                search_from = max(len(buf) - 8, 0)
+                buf.extend(chunk)
+                if not head_checked:
+                    head_end = _HEAD_END_BYTES_RE.search(buf, search_from)
+                    if head_end:
+                        head_checked = True
+                        head = bytes(buf[: head_end.end()])
+                        image = _find_meta_image(html_input(head, charset))
+                        if image:
+                            return image
+                if len(buf) >= _MAX_BYTES:
+                    break
+        except httpx.DecodingError:
+            # A compressed body cut short by Range cannot be finalized;
+            # the bytes decoded so far are still usable.
+            pass
+
+    html = html_input(bytes(buf), charset)
+    if head_checked:
+        return _find_body_image(html)
+    return _find_image(html)
+
+
+def _find_image(html: str | bytes) -> str | None:
+    """Find the best representative image in an HTML document.
+
+    Args:
+        html: HTML document (str, or UTF-8 bytes).
+
+    Returns:
+        The image URL if found, None otherwise.
+    """
+    return _find_meta_image(html) or _find_body_image(html)
+
+
+def _find_meta_image(html: str | bytes) -> str | None:
+    """Find an og:image or twitter:image meta tag.
+
+    Meta tags live in <head>, so only that part of the document is parsed.
+
+    Args:
+        html: HTML document (str, or UTF-8 bytes), complete or truncated after <head>.
+
+    Returns:
+        The image URL if found, None otherwise.
+    """
+    head_end_re = _HEAD_END_BYTES_RE if isinstance(html, bytes) else _HEAD_END_RE
+    head_end = head_end_re.search(html)
+    tree = LexborHTMLParser(html[: head_end.end()] if head_end else html)
+
+    # og:image wins over twitter:image; both are found in one pass
+    twitter_image = None
+    for meta in tree.css(_META_IMAGE_SELECTOR):
+        content = meta.attributes.get("content")
+        if not content:
+            continue
+        if meta.attributes.get("property") == "og:image":
+            return content
+        twitter_image = twitter_image or content
+
+    return twitter_image
+
+
+def _find_body_image(html: str | bytes) -> str | None:
+    """Find the first image in the document that is not an icon or logo.
+
+    Args:
+        html: HTML document (str, or UTF-8 bytes).
+
+    Returns:
+        The image URL if found, None otherwise.
+    """
+    tree = LexborHTMLParser(html)
+    for img in tree.css("img"):
+        src = img.attributes.get("src") or img.attributes.get("data-src")
+        if src and not _is_icon_or_logo(src):
+            return src
+    return None
+
 
 def _is_icon_or_logo(src: str) -> bool:
     """Check if image URL looks like an icon or logo."""
-    src_lower = src.lower()
-    return any(
-        x in src_lower
-        for x in ["icon", "logo", "avatar", "favicon", "sprite", "1x1", "pixel"]
-    )
+    return _ICON_OR_LOGO_RE.search(src) is not None
@@ -1,27 +1,102 @@
 """Web scraper for collecting articles from specific sites."""
 
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 from datetime import datetime
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import urljoin, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from ..core.config import SiteConfig
 from ..core.exceptions import CollectorError
+from ..core.http_client import fetch_html
 from ..models.article import Article
 from .base import BaseCollector
 
 
+class _Selectors(NamedTuple):
+    """CSS selectors used to extract article fields."""
+
+    article: str
+    title: str
+    link: str
+    content: str
+    date: str
+    image: str
+
+
+@lru_cache(maxsize=128)
+def _resolve_selectors(items: frozenset[tuple[str, str]]) -> _Selectors:
+    """Resolve configured selectors against defaults, cached per site."""
+    selectors = dict(items)
+    return _Selectors(
+        article=selectors.get("article", "article"),
+        title=selectors.get("title", "h2 a, h3 a"),
+        link=selectors.get("link", "a"),
+        content=selectors.get("content", "p"),
+        date=selectors.get("date", "time"),
+        image=selectors.get("image", "img"),
+    )
+
+
+@dataclass(slots=True)
+class _ParsedPage:
+    """Articles extracted from a page body."""
+
+    html: str | bytes
+    articles: list[Article]
+
+
+# Pages come back unchanged (304 Not Modified, or the same body) on most
+# scheduled runs, so their articles are kept to skip parsing them again.
+_parsed_pages: dict[tuple[str, frozenset[tuple[str, str]], str], _ParsedPage] = {}
+
+
+def _url_resolver(base_url: str) -> Callable[[str], str]:
+    """Build a function resolving links against base_url.
+
+    Absolute and root-relative links, the common cases, are handled without
+    re-parsing base_url; anything else falls back to urljoin.
+    """
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+
+    def resolve(href: str) -> str:
+        if href.startswith(("http://", "https://")):
+            return href
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            return origin + href
+        return urljoin(base_url, href)
+
+    return resolve
+
+
 class WebScraper(BaseCollector):
     """Collector that scrapes configured websites."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 16,
+        max_per_host: int = 4,
+    ):
         """Initialize web scraper.
 
         Args:
             timeout: Request timeout in seconds.
+            client: Optional HTTP client. Defaults to the shared client.
+            max_concurrency: Maximum number of sites scraped at once.
+            max_per_host: Maximum number of concurrent requests to one host.
         """
         self._timeout = timeout
+        self._client = client
+        self._max_concurrency = max_concurrency
+        self._max_per_host = max_per_host
 
     @property
     def name(self) -> str:
@@ -52,22 +127,22 @@ class WebScraper(BaseCollector):
             source_name = kwargs.get("source_name", "Web")
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(
-                    url,
-                    headers={
-                        "User-Agent": (
-                            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                            "AppleWebKit/537.36 (KHTML, like Gecko) "
-                            "Chrome/120.0.0.0 Safari/537.36"
-                        )
-                    },
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
-            articles = self._extract_articles(soup, url, selectors, source_name)
+            html = await fetch_html(url, timeout=self._timeout, client=self._client)
+
+            key = (url, frozenset(selectors.items()), source_name)
+            parsed = _parsed_pages.get(key)
+            if parsed is not None and parsed.html == html:
+                collected_at = datetime.now()
+                return [
+                    article.model_copy(update={"collected_at": collected_at})
+                    for article in parsed.articles
+                ]
+
+            # Parse in a worker thread so other sites keep downloading meanwhile
+            articles = await asyncio.to_thread(
+                self._parse_articles, html, url, selectors, source_name
+            )
+            _parsed_pages[key] = _ParsedPage(html=html, articles=articles)
             return articles
 
         except httpx.HTTPError as e:
@@ -75,9 +150,20 @@ class WebScraper(BaseCollector):
         except Exception as e:
             raise CollectorError(f"Scraping failed for {url}: {e}") from e
 
+    def _parse_articles(
+        self,
+        html: str | bytes,
+        base_url: str,
+        selectors: dict[str, str],
+        source_name: str,
+    ) -> list[Article]:
+        """Parse an HTML page and extract its articles."""
+        tree = LexborHTMLParser(html)
+        return self._extract_articles(tree, base_url, selectors, source_name)
+
     def _extract_articles(
         self,
-        soup: BeautifulSoup,
+        tree: LexborHTMLParser,
         base_url: str,
         selectors: dict[str, str],
         source_name: str,
@@ -85,7 +171,7 @@ class WebScraper(BaseCollector):
         """Extract articles from parsed HTML.
 
         Args:
-            soup: Parsed HTML.
+            tree: Parsed HTML.
             base_url: Base URL for resolving relative links.
             selectors: CSS selectors for article elements.
             source_name: Name of the source site.
@@ -93,97 +179,138 @@ class WebScraper(BaseCollector):
         Returns:
             List of extracted articles.
         """
-        articles = []
-        article_selector = selectors.get("article", "article")
-        title_selector = selectors.get("title", "h2 a, h3 a")
-        link_selector = selectors.get("link", "a")
-        content_selector = selectors.get("content", "p")
-        date_selector = selectors.get("date", "time")
-        image_selector = selectors.get("image", "img")
-
-        article_elements = soup.select(article_selector)
-
-        for element in article_elements:
-            try:
-                # Extract title
-                title_elem = element.select_one(title_selector)
-                if not title_elem:
-                    continue
-                title = title_elem.get_text(strip=True)
-
-                # Extract link
-                link_elem = element.select_one(link_selector)
-                if link_elem and link_elem.get("href"):
-                    url = urljoin(base_url, link_elem["href"])
-                else:
-                    continue
-
-                # Extract content/description
-                content_elem = element.select_one(content_selector)
-                content = content_elem.get_text(strip=True) if content_elem else ""
-
-                # Extract date
-                date_elem = element.select_one(date_selector)
-                published_at = None
-                if date_elem:
-                    datetime_attr = date_elem.get("datetime")
-                    if datetime_attr:
-                        try:
-                            published_at = datetime.fromisoformat(
-                                datetime_attr.replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            pass
-
-                # Extract image
-                image_url = None
-                img_elem = element.select_one(image_selector)
-                if img_elem:
-                    # Try different image attributes
-                    image_src = (
-                        img_elem.get("src")
-                        or img_elem.get("data-src")
-                        or img_elem.get("data-lazy-src")
-                    )
-                    if image_src:
-                        image_url = urljoin(base_url, image_src)
-
-                article = Article(
-                    title=title,
-                    url=url,
-                    content=content,
-                    source=source_name,
-                    image_url=image_url,
-                    published_at=published_at,
-                    collected_at=datetime.now(),
-                )
-                articles.append(article)
-
-            except Exception:
-                # Skip malformed articles
-                continue
-
-        return articles
-
-    async def collect_from_sites(
-        self, sites: list[SiteConfig]
-    ) -> list[Article]:
+        sel = _resolve_selectors(frozenset(selectors.items()))
+        collected_at = datetime.now()
+
+        resolve_url = _url_resolver(base_url)
+
+        extracted = (
+            self._extract_article(element, sel, resolve_url, source_name, collected_at)
+            for element in tree.css(sel.article)
+        )
+        return [article for article in extracted if article is not None]
+
+    def _extract_article(
+        self,
+        element: LexborNode,
+        sel: _Selectors,
+        resolve_url: Callable[[str], str],
+        source_name: str,
+        collected_at: datetime,
+    ) -> Article | None:
+        """Extract a single article from its HTML element.
+
+        Args:
+            element: Article element.
+            sel: Resolved CSS selectors.
+            resolve_url: Function resolving relative links against the page URL.
+            source_name: Name of the source site.
+            collected_at: Collection timestamp shared by the page.
+
+        Returns:
+            The article, or None if the element is malformed.
+        """
+        try:
+            # Extract title
+            title_elem = element.css_first(sel.title)
+            if not title_elem:
+                return None
+            title = title_elem.text(strip=True)
+
+            # Extract link
+            link_elem = element.css_first(sel.link)
+            href = link_elem.attributes.get("href") if link_elem else None
+            if not href:
+                return None
+            url = resolve_url(href)
+
+            # Extract content/description
+            content_elem = element.css_first(sel.content)
+            content = content_elem.text(strip=True) if content_elem else ""
+
+            # Extract date
+            date_elem = element.css_first(sel.date)
+            published_at = None
+            if date_elem:
+                datetime_attr = date_elem.attributes.get("datetime")
+                if datetime_attr:
+                    try:
+                        published_at = datetime.fromisoformat(datetime_attr)
+                    except ValueError:
+                        pass
+
+            # Extract image
+            image_url = None
+            img_elem = element.css_first(sel.image)
+            if img_elem:
+                # Try different image attributes
+                attrs = img_elem.attributes
+                image_src = attrs.get("src") or attrs.get("data-src") or attrs.get("data-lazy-src")
+                if image_src:
+                    image_url = resolve_url(image_src)
+
+            return Article(
+                title=title,
+                url=url,
+                content=content,
+                source=source_name,
+                image_url=image_url,
+                published_at=published_at,
+                collected_at=collected_at,
+            )
+
+        except Exception:
+            # Skip malformed articles
+            return None
+
+    async def collect_from_sites(self, sites: list[SiteConfig]) -> list[Article]:
         """Collect articles from multiple configured sites.
 
         Args:
             sites: List of site configurations.
 
         Returns:
-            Combined list of articles from all sites.
+            Combined list of articles from all sites, without duplicate URLs.
         """
-        all_articles = []
-        for site in sites:
-            if not site.enabled:
-                continue
-            try:
-                articles = await self.collect(site.url, site_config=site)
-                all_articles.extend(articles)
-            except CollectorError:
-                # Log error but continue with other sites
-                continue
-        return all_articles
+        return [article async for article in self.stream_from_sites(sites)]
+
+    async def stream_from_sites(self, sites: list[SiteConfig]) -> AsyncIterator[Article]:
+        """Yield articles from multiple configured sites as each site finishes.
+
+        Args:
+            sites: List of site configurations.
+
+        Yields:
+            Articles from all sites, without duplicate URLs.
+        """
+        # Bound concurrency overall and per host so many sites (or several
+        # pages of one site) don't trigger connection resets and rate limits
+        semaphore = asyncio.BoundedSemaphore(self._max_concurrency)
+        host_semaphores: dict[str, asyncio.BoundedSemaphore] = {}
+
+        async def collect_site(site: SiteConfig) -> list[Article]:
+            host = urlsplit(site.url).netloc
+            host_semaphore = host_semaphores.setdefault(
+                host, asyncio.BoundedSemaphore(self._max_per_host)
+            )
+            async with host_semaphore, semaphore:
+                try:
+                    return await self.collect(site.url, site_config=site)
+                except CollectorError:
+                    # Log error but continue with other sites
+                    return []
+
+        tasks = [asyncio.create_task(collect_site(site)) for site in sites if site.enabled]
+        seen_urls: set[str] = set()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                # Skip articles already collected from another site
+                for article in await next_done:
+                    url_str = article.url_str
+                    if url_str not in seen_urls:
+                        seen_urls.add(url_str)
+                        yield article
+        finally:
+            # Stop the remaining sites if the consumer stops early or one fails
+            for task in tasks:
+                task.cancel()
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 
 from tavily import TavilyClient
 
@@ -14,17 +15,24 @@ from .image_extractor import extract_og_image
 class TavilyCollector(BaseCollector):
     """Collector that uses Tavily API for news search."""
 
-    def __init__(self, api_key: str, fetch_images: bool = True):
+    def __init__(
+        self,
+        api_key: str,
+        fetch_images: bool = True,
+        max_concurrent_images: int = 10,
+    ):
         """Initialize Tavily collector.
 
         Args:
             api_key: Tavily API key.
             fetch_images: Whether to fetch og:image from each article.
+            max_concurrent_images: Maximum number of og:image fetches in flight.
         """
         if not api_key:
             raise CollectorError("Tavily API key is required")
         self._client = TavilyClient(api_key=api_key)
         self._fetch_images = fetch_images
+        self._image_semaphore = asyncio.Semaphore(max_concurrent_images)
 
     @property
     def name(self) -> str:
@@ -52,8 +60,9 @@ class TavilyCollector(BaseCollector):
             List of articles found.
         """
         try:
-            # Tavily search is synchronous, but we wrap it for async interface
-            response = self._client.search(
+            # Tavily search is synchronous, so run it off the event loop
+            response = await asyncio.to_thread(
+                self._client.search,
                 query=query,
                 topic="news",
                 days=self._time_range_to_days(time_range),
@@ -63,6 +72,7 @@ class TavilyCollector(BaseCollector):
             )
 
             articles = []
+            collected_at = datetime.now()
             for result in response.get("results", []):
                 article = Article(
                     title=result.get("title", "Untitled"),
@@ -71,7 +81,7 @@ class TavilyCollector(BaseCollector):
                     source="Tavily Search",
                     image_url=None,  # Will be fetched below
                     published_at=self._parse_date(result.get("published_date")),
-                    collected_at=datetime.now(),
+                    collected_at=collected_at,
                     keywords=[query],
                     score=result.get("score"),
                 )
@@ -79,9 +89,7 @@ class TavilyCollector(BaseCollector):
 
             # Fetch og:image for each article in parallel
             if self._fetch_images and articles:
-                image_tasks = [
-                    extract_og_image(str(article.url)) for article in articles
-                ]
+                image_tasks = [self._fetch_image(article.url_str) for article in articles]
                 images = await asyncio.gather(*image_tasks, return_exceptions=True)
                 for article, image in zip(articles, images):
                     if isinstance(image, str):
@@ -92,6 +100,11 @@ class TavilyCollector(BaseCollector):
         except Exception as e:
             raise CollectorError(f"Tavily search failed: {e}") from e
 
+    async def _fetch_image(self, url: str) -> str | None:
+        """Fetch og:image for a URL, bounded by the image semaphore."""
+        async with self._image_semaphore:
+            return await extract_og_image(url)
+
     def _time_range_to_days(self, time_range: str) -> int:
         """Convert time range string to days."""
         mapping = {
@@ -102,11 +115,16 @@ class TavilyCollector(BaseCollector):
         }
         return mapping.get(time_range, 7)
 
-    def _parse_date(self, date_str: str | None) -> datetime | None:
-        """Parse date string to datetime."""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_date(date_str: str | None) -> datetime | None:
+        """Parse date string to datetime.
+
+        Cached because the same dates recur across keyword searches.
+        """
         if not date_str:
             return None
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            return datetime.fromisoformat(date_str)
         except ValueError:
             return None
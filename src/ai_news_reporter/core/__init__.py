@@ -1,5 +1,5 @@
 """Core configuration and utilities."""
 
-from .config import Settings, AppConfig
+from .config import Settings, AppConfig, get_settings
 
-__all__ = ["Settings", "AppConfig"]
+__all__ = ["Settings", "AppConfig", "get_settings"]
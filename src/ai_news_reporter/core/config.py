@@ -1,5 +1,7 @@
 """Configuration management using Pydantic Settings and YAML."""
 
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .exceptions import ConfigurationError
 
+# Use the libyaml C loader when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Settings(BaseSettings):
     """Environment settings loaded from .env file."""
@@ -40,45 +45,94 @@ class Settings(BaseSettings):
     config_path: str = Field(default="config/config.yaml", alias="CONFIG_PATH")
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get environment settings, reading config/.env only once per process."""
+    return Settings()
+
+
+@dataclass(slots=True, frozen=True)
 class SiteConfig:
     """Configuration for a single site to scrape."""
 
-    def __init__(self, data: dict[str, Any]):
-        self.name: str = data.get("name", "Unknown")
-        self.url: str = data.get("url", "")
-        self.enabled: bool = data.get("enabled", True)
-        self.selectors: dict[str, str] = data.get("selectors", {})
+    name: str = "Unknown"
+    url: str = ""
+    enabled: bool = True
+    selectors: dict[str, str] = field(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SiteConfig":
+        """Create configuration from a YAML mapping."""
+        return cls(
+            name=data.get("name", "Unknown"),
+            url=data.get("url", ""),
+            enabled=data.get("enabled", True),
+            selectors=data.get("selectors", {}),
+        )
 
+
+@dataclass(slots=True, frozen=True)
 class SearchConfig:
     """Search configuration."""
 
-    def __init__(self, data: dict[str, Any]):
-        self.enabled: bool = data.get("enabled", True)
-        self.time_range: str = data.get("time_range", "week")
-        self.max_results_per_keyword: int = data.get("max_results_per_keyword", 10)
-        self.include_domains: list[str] = data.get("include_domains", [])
-        self.exclude_domains: list[str] = data.get("exclude_domains", [])
-
-
+    enabled: bool = True
+    time_range: str = "week"
+    max_results_per_keyword: int = 10
+    max_concurrency: int = 8
+    include_domains: list[str] = field(default_factory=list)
+    exclude_domains: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SearchConfig":
+        """Create configuration from a YAML mapping."""
+        return cls(
+            enabled=data.get("enabled", True),
+            time_range=data.get("time_range", "week"),
+            max_results_per_keyword=data.get("max_results_per_keyword", 10),
+            max_concurrency=data.get("max_concurrency", 8),
+            include_domains=data.get("include_domains", []),
+            exclude_domains=data.get("exclude_domains", []),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class ScheduleConfig:
     """Schedule configuration."""
 
-    def __init__(self, data: dict[str, Any]):
-        self.enabled: bool = data.get("enabled", True)
-        self.type: str = data.get("type", "weekly")
-        self.day_of_week: str = data.get("day_of_week", "monday")
-        self.time: str = data.get("time", "09:00")
-        self.timezone: str = data.get("timezone", "UTC")
-
-
+    enabled: bool = True
+    type: str = "weekly"
+    day_of_week: str = "monday"
+    time: str = "09:00"
+    timezone: str = "UTC"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScheduleConfig":
+        """Create configuration from a YAML mapping."""
+        return cls(
+            enabled=data.get("enabled", True),
+            type=data.get("type", "weekly"),
+            day_of_week=data.get("day_of_week", "monday"),
+            time=data.get("time", "09:00"),
+            timezone=data.get("timezone", "UTC"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class DeliveryConfig:
     """Delivery configuration."""
 
-    def __init__(self, data: dict[str, Any]):
-        self.email = data.get("email", {})
-        self.slack = data.get("slack", {})
-        self.file = data.get("file", {})
+    email: dict[str, Any] = field(default_factory=dict)
+    slack: dict[str, Any] = field(default_factory=dict)
+    file: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DeliveryConfig":
+        """Create configuration from a YAML mapping."""
+        return cls(
+            email=data.get("email", {}),
+            slack=data.get("slack", {}),
+            file=data.get("file", {}),
+        )
 
     @property
     def email_enabled(self) -> bool:
@@ -113,34 +167,59 @@ class DeliveryConfig:
         return self.file.get("formats", ["markdown"])
 
 
+@dataclass(slots=True, frozen=True)
 class LLMConfig:
     """LLM configuration."""
 
-    def __init__(self, data: dict[str, Any]):
-        self.provider: str = data.get("provider", "claude")
-        self.model: str = data.get("model", "claude-sonnet-4-20250514")
-        self.max_tokens: int = data.get("max_tokens", 4096)
-        self.temperature: float = data.get("temperature", 0.3)
-        # summary_prompt is deprecated - use report.focus instead
-        # Return None to use the built-in DEFAULT_SUMMARY_PROMPT
-        self.summary_prompt: str | None = data.get("summary_prompt")
-
-
+    provider: str = "claude"
+    model: str = "claude-sonnet-4-20250514"
+    max_tokens: int = 4096
+    temperature: float = 0.3
+    # summary_prompt is deprecated - use report.focus instead
+    # None means use the built-in DEFAULT_SUMMARY_PROMPT
+    summary_prompt: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LLMConfig":
+        """Create configuration from a YAML mapping."""
+        return cls(
+            provider=data.get("provider", "claude"),
+            model=data.get("model", "claude-sonnet-4-20250514"),
+            max_tokens=data.get("max_tokens", 4096),
+            temperature=data.get("temperature", 0.3),
+            summary_prompt=data.get("summary_prompt"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class ReportConfig:
     """Report configuration."""
 
-    def __init__(self, data: dict[str, Any]):
-        self.title: str = data.get("title", "AI News Weekly Report")
-        self.max_articles: int = data.get("max_articles", 50)
-        self.deduplicate: bool = data.get("deduplicate", True)
-        self.include_sources: bool = data.get("include_sources", True)
-        self.highlight_count: int = data.get("highlight_count", 10)
-        self.focus: str = data.get("focus", "")
+    title: str = "AI News Weekly Report"
+    max_articles: int = 50
+    deduplicate: bool = True
+    include_sources: bool = True
+    highlight_count: int = 10
+    focus: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ReportConfig":
+        """Create configuration from a YAML mapping."""
+        return cls(
+            title=data.get("title", "AI News Weekly Report"),
+            max_articles=data.get("max_articles", 50),
+            deduplicate=data.get("deduplicate", True),
+            include_sources=data.get("include_sources", True),
+            highlight_count=data.get("highlight_count", 10),
+            focus=data.get("focus", ""),
+        )
 
 
 class AppConfig:
     """Application configuration loaded from YAML file."""
 
+    _CACHED_SECTIONS = ("keywords", "sites", "search", "schedule", "delivery", "llm", "report")
+
     def __init__(self, config_path: Path | str = Path("config/config.yaml")):
         self._config_path = Path(config_path)
         self._config: dict[str, Any] = {}
@@ -152,43 +231,45 @@ class AppConfig:
             raise ConfigurationError(f"Config file not found: {self._config_path}")
 
         with open(self._config_path) as f:
-            self._config = yaml.safe_load(f) or {}
+            self._config = yaml.load(f, Loader=_YamlLoader) or {}
 
     def reload(self) -> None:
         """Reload configuration from file."""
         self._load()
+        for name in self._CACHED_SECTIONS:
+            self.__dict__.pop(name, None)
 
-    @property
+    @cached_property
     def keywords(self) -> list[str]:
         """Get search keywords."""
         return self._config.get("keywords", [])
 
-    @property
+    @cached_property
     def sites(self) -> list[SiteConfig]:
         """Get site configurations."""
-        return [SiteConfig(s) for s in self._config.get("sites", [])]
+        return [SiteConfig.from_dict(s) for s in self._config.get("sites", [])]
 
-    @property
+    @cached_property
     def search(self) -> SearchConfig:
         """Get search configuration."""
-        return SearchConfig(self._config.get("search", {}))
+        return SearchConfig.from_dict(self._config.get("search", {}))
 
-    @property
+    @cached_property
     def schedule(self) -> ScheduleConfig:
         """Get schedule configuration."""
-        return ScheduleConfig(self._config.get("schedule", {}))
+        return ScheduleConfig.from_dict(self._config.get("schedule", {}))
 
-    @property
+    @cached_property
     def delivery(self) -> DeliveryConfig:
         """Get delivery configuration."""
-        return DeliveryConfig(self._config.get("delivery", {}))
+        return DeliveryConfig.from_dict(self._config.get("delivery", {}))
 
-    @property
+    @cached_property
     def llm(self) -> LLMConfig:
         """Get LLM configuration."""
-        return LLMConfig(self._config.get("llm", {}))
+        return LLMConfig.from_dict(self._config.get("llm", {}))
 
-    @property
+    @cached_property
     def report(self) -> ReportConfig:
         """Get report configuration."""
-        return ReportConfig(self._config.get("report", {}))
+        return ReportConfig.from_dict(self._config.get("report", {}))
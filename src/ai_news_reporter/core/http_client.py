@@ -0,0 +1,149 @@
+"""Shared HTTP client for collectors."""
+
+from dataclasses import dataclass
+
+import httpx
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+DEFAULT_TIMEOUT = 30
+
+_client: httpx.AsyncClient | None = None
+
+
+@dataclass(slots=True)
+class _CachedPage:
+    """Body and validators of a previously fetched page."""
+
+    content: bytes
+    charset: str | None
+    etag: str | None
+    last_modified: str | None
+
+
+# Kept for the life of the process so scheduled runs can revalidate pages
+# fetched by earlier runs instead of downloading them again.
+_page_cache: dict[str, _CachedPage] = {}
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use.
+
+    The client keeps a connection pool alive across requests so repeated
+    fetches skip the TCP/TLS handshake. Its connections belong to the event
+    loop that first used it, so call close_client() before that loop ends
+    (run_report_async does so after every run); the next call then creates
+    a fresh client.
+
+    Returns:
+        Shared httpx.AsyncClient instance.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30,
+            ),
+            follow_redirects=True,
+        )
+    return _client
+
+
+def html_input(content: bytes, charset: str | None) -> str | bytes:
+    """Prepare a response body for the HTML parser without needless decoding.
+
+    lexbor parses bytes as UTF-8 directly, so the body is only decoded to str
+    when the server declares a different charset.
+
+    Args:
+        content: Raw response body.
+        charset: Charset from the Content-Type header, if any.
+
+    Returns:
+        The body as bytes for UTF-8 pages, otherwise the decoded text.
+    """
+    if charset is None or charset.lower().replace("_", "-") in ("utf-8", "utf8"):
+        return content
+    return content.decode(charset, errors="replace")
+
+
+async def fetch_html(
+    url: str,
+    timeout: float | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> str | bytes:
+    """Fetch an HTML page, revalidating earlier copies with ETag/Last-Modified.
+
+    When the server answers 304 Not Modified the cached body is reused, so
+    unchanged pages cost a single header round trip.
+
+    Args:
+        url: Page URL.
+        timeout: Request timeout in seconds. Defaults to the client timeout.
+        client: Optional HTTP client. Defaults to the shared client.
+
+    Returns:
+        Page body ready for the HTML parser (see html_input).
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status.
+    """
+    client = client or await get_client()
+    cached = _page_cache.get(url)
+
+    headers = None
+    if cached:
+        headers = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    # Stream so error and 304 responses are handled from the status line
+    # alone; the body is only downloaded for successful responses
+    async with client.stream(
+        "GET", url, headers=headers, timeout=timeout or httpx.USE_CLIENT_DEFAULT
+    ) as response:
+        if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+            return html_input(cached.content, cached.charset)
+        response.raise_for_status()
+        content = await response.aread()
+
+    charset = response.charset_encoding
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _page_cache[url] = _CachedPage(
+            content=content,
+            charset=charset,
+            etag=etag,
+            last_modified=last_modified,
+        )
+    else:
+        _page_cache.pop(url, None)
+
+    return html_input(content, charset)
+
+
+async def close_client() -> None:
+    """Close the shared async HTTP client if it was created."""
+    global _client
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
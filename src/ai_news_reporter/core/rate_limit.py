@@ -0,0 +1,91 @@
+"""Client-side request and token rate limiting for LLM APIs."""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimits:
+    """Per-minute request and token budget of a model."""
+
+    rpm: int
+    tpm: int
+
+
+# Anthropic tier-1 limits by model prefix (longest prefix wins). Token limits
+# are the input-token budgets, which keeps the combined estimate conservative.
+MODEL_RATE_LIMITS: dict[str, RateLimits] = {
+    "claude-opus-4": RateLimits(rpm=50, tpm=30_000),
+    "claude-sonnet-4": RateLimits(rpm=50, tpm=30_000),
+    "claude-3-7-sonnet": RateLimits(rpm=50, tpm=20_000),
+    "claude-3-5-sonnet": RateLimits(rpm=50, tpm=40_000),
+    "claude-3-5-haiku": RateLimits(rpm=50, tpm=50_000),
+    "claude-3-haiku": RateLimits(rpm=50, tpm=50_000),
+}
+DEFAULT_RATE_LIMITS = RateLimits(rpm=50, tpm=20_000)
+
+
+def rate_limits_for_model(model: str) -> RateLimits:
+    """Look up the rate limits of a model.
+
+    Args:
+        model: Model name, e.g. "claude-sonnet-4-20250514".
+
+    Returns:
+        Limits for the longest matching prefix, or DEFAULT_RATE_LIMITS.
+    """
+    matches = [prefix for prefix in MODEL_RATE_LIMITS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_RATE_LIMITS
+    return MODEL_RATE_LIMITS[max(matches, key=len)]
+
+
+class SlidingWindow:
+    """Sliding-window limiter for requests and tokens per minute.
+
+    acquire() waits until both the request count and the token sum of the
+    calls made within the last window leave room for the new call.
+    """
+
+    def __init__(self, rpm: int, tpm: int, window: float = 60.0):
+        """Initialize limiter.
+
+        Args:
+            rpm: Maximum requests per window.
+            tpm: Maximum (estimated) tokens per window.
+            window: Window length in seconds.
+        """
+        self._rpm = rpm
+        self._tpm = tpm
+        self._window = window
+        self._calls: deque[tuple[float, int]] = deque()
+        self._tokens = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait for budget and record a call.
+
+        A call estimated above the whole token budget still goes through once
+        the window is empty, so it cannot block forever.
+
+        Args:
+            tokens: Estimated tokens used by the call.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                cutoff = now - self._window
+                while self._calls and self._calls[0][0] <= cutoff:
+                    self._tokens -= self._calls.popleft()[1]
+
+                if not self._calls or (
+                    len(self._calls) < self._rpm and self._tokens + tokens <= self._tpm
+                ):
+                    break
+                # Sleep until the oldest call leaves the window
+                await asyncio.sleep(self._calls[0][0] - cutoff)
+
+            self._calls.append((now, tokens))
+            self._tokens += tokens
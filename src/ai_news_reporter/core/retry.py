@@ -0,0 +1,157 @@
+"""Retry with backoff and adaptive concurrency for rate-limited APIs."""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Self, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# 429 Too Many Requests, 5xx server errors and Anthropic's 529 Overloaded
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+
+class AIMDLimiter:
+    """Concurrency limit adjusted by additive increase / multiplicative decrease.
+
+    Each success raises the limit by about one slot per full window of
+    requests; each overload signal (429 or 5xx) multiplies it by `decrease`.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        decrease: float = 0.5,
+    ):
+        """Initialize limiter.
+
+        Args:
+            initial: Starting number of concurrent slots.
+            min_limit: Lowest the limit can shrink to.
+            max_limit: Highest the limit can grow to.
+            decrease: Factor applied to the limit on overload.
+        """
+        self._limit = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._decrease = decrease
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get the current number of concurrent slots."""
+        return max(self._min_limit, int(self._limit))
+
+    async def __aenter__(self) -> Self:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        """Additively increase the limit after a successful request."""
+        self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def on_overload(self) -> None:
+        """Multiplicatively decrease the limit after a rate-limit or server error."""
+        self._limit = max(self._min_limit, self._limit * self._decrease)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Check if an error is a transient network, rate-limit or server error.
+
+    Works with httpx errors and with SDK errors that expose the HTTP status
+    (e.g. anthropic.APIStatusError).
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return _status_code(exc) in RETRYABLE_STATUS_CODES
+
+
+async def with_backoff(
+    func: Callable[[], Awaitable[T]],
+    max_attempts: int = 8,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    retry_on: Callable[[BaseException], bool] = is_retryable,
+    limiter: AIMDLimiter | None = None,
+) -> T:
+    """Await func(), retrying transient failures with exponential backoff.
+
+    The delay doubles on each attempt up to max_delay, with random jitter,
+    unless the server sent a Retry-After header.
+
+    Args:
+        func: Factory returning a fresh awaitable for each attempt.
+        max_attempts: Maximum number of attempts.
+        base_delay: Delay before the first retry in seconds.
+        max_delay: Upper bound for a single delay in seconds.
+        retry_on: Predicate deciding whether an error is retryable.
+        limiter: Optional limiter held during each attempt and fed its outcome.
+
+    Returns:
+        Result of the first successful attempt.
+
+    Raises:
+        Exception: The last error once it is not retryable or attempts run out.
+    """
+    for attempt in range(max_attempts):
+        try:
+            if limiter is None:
+                result = await func()
+            else:
+                async with limiter:
+                    result = await func()
+        except Exception as e:
+            if not retry_on(e) or attempt == max_attempts - 1:
+                raise
+            if limiter is not None and _status_code(e) is not None:
+                limiter.on_overload()
+            delay = _retry_after(e)
+            if delay is None:
+                delay = min(max_delay, base_delay * 2**attempt)
+            await asyncio.sleep(min(delay, max_delay) + random.uniform(0, base_delay))
+        else:
+            if limiter is not None:
+                limiter.on_success()
+            return result
+
+    raise AssertionError("unreachable")
+
+
+def _status_code(exc: BaseException) -> int | None:
+    """Get the HTTP status code carried by an error, if any."""
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Get the server-requested retry delay in seconds from Retry-After."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
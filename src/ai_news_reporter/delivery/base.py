@@ -25,3 +25,6 @@ class BaseDelivery(ABC):
     def name(self) -> str:
         """Get the delivery method name."""
         pass
+
+    async def close(self) -> None:
+        """Release resources such as open connections. No-op by default."""
@@ -1,9 +1,11 @@
 """Email (SMTP) delivery method."""
 
-import smtplib
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
+import aiosmtplib
+
 from ..core.exceptions import DeliveryError
 from ..models.report import Report
 from .base import BaseDelivery
@@ -20,6 +22,7 @@ class EmailDelivery(BaseDelivery):
         password: str,
         recipients: list[str],
         subject_prefix: str = "[AI News Weekly]",
+        max_idle: float = 300,
     ):
         """Initialize email delivery.
 
@@ -30,6 +33,7 @@ class EmailDelivery(BaseDelivery):
             password: SMTP password.
             recipients: List of email recipients.
             subject_prefix: Prefix for email subject.
+            max_idle: Seconds an idle SMTP connection is kept for reuse.
         """
         self._host = host
         self._port = port
@@ -37,6 +41,9 @@ class EmailDelivery(BaseDelivery):
         self._password = password
         self._recipients = recipients
         self._subject_prefix = subject_prefix
+        self._max_idle = max_idle
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._last_used = 0.0
 
     @property
     def name(self) -> str:
@@ -69,12 +76,50 @@ class EmailDelivery(BaseDelivery):
             # Attach HTML version
             msg.attach(MIMEText(report.content_html, "html", "utf-8"))
 
-            with smtplib.SMTP(self._host, self._port) as server:
-                server.starttls()
-                server.login(self._user, self._password)
-                server.send_message(msg)
+            try:
+                smtp = await self._get_connection()
+                await smtp.send_message(msg, sender=self._user, recipients=self._recipients)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server dropped the reused connection; reconnect once
+                await self.close()
+                smtp = await self._get_connection()
+                await smtp.send_message(msg, sender=self._user, recipients=self._recipients)
+            self._last_used = time.monotonic()
 
             return True
 
-        except smtplib.SMTPException as e:
+        except aiosmtplib.SMTPException as e:
             raise DeliveryError(f"Failed to send email: {e}") from e
+
+    async def close(self) -> None:
+        """Close the SMTP connection if one is open."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None and smtp.is_connected:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                smtp.close()
+
+    async def _get_connection(self) -> aiosmtplib.SMTP:
+        """Get a logged-in SMTP connection, reusing the previous one if fresh.
+
+        Returns:
+            Connected SMTP client.
+        """
+        if self._smtp is not None and (
+            not self._smtp.is_connected or time.monotonic() - self._last_used > self._max_idle
+        ):
+            await self.close()
+
+        if self._smtp is None:
+            smtp = aiosmtplib.SMTP(
+                hostname=self._host,
+                port=self._port,
+                username=self._user,
+                password=self._password,
+                start_tls=True,
+            )
+            await smtp.connect()
+            self._smtp = smtp
+            self._last_used = time.monotonic()
+        return self._smtp
@@ -1,8 +1,9 @@
 """File output delivery method."""
 
-import json
 from pathlib import Path
 
+import orjson
+
 from ..core.exceptions import DeliveryError
 from ..models.report import Report
 from .base import BaseDelivery
@@ -54,26 +55,22 @@ class FileDelivery(BaseDelivery):
                     filepath = self._output_dir / f"report_{date_str}.json"
                     data = {
                         "title": report.title,
-                        "date": report.date.isoformat(),
+                        "date": report.date,
                         "summary": report.summary,
                         "article_count": report.article_count,
                         "articles": [
                             {
                                 "title": a.title,
-                                "url": str(a.url),
+                                "url": a.url_str,
                                 "source": a.source,
                                 "image_url": a.image_url,
-                                "published_at": (
-                                    a.published_at.isoformat() if a.published_at else None
-                                ),
+                                "published_at": a.published_at,
                             }
                             for a in report.articles
                         ],
                     }
-                    filepath.write_text(
-                        json.dumps(data, indent=2, ensure_ascii=False),
-                        encoding="utf-8",
-                    )
+                    # orjson writes UTF-8 and serializes date/datetime as ISO 8601
+                    filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
                 else:
                     continue
 
@@ -1,23 +1,51 @@
 """Slack Bot delivery method for sending DMs to users."""
 
+import asyncio
+
 import httpx
+import orjson
 
 from ..core.exceptions import DeliveryError
+from ..core.retry import AIMDLimiter, with_backoff
 from ..models.report import Report
 from .base import BaseDelivery
 
+# Static blocks shared by every message; they are only serialized, never mutated
+_DIVIDER_BLOCK = {"type": "divider"}
+_TOP_SOURCES_BLOCK = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": "*Top Sources:*"},
+}
+
+
+def _truncate_text(text: str, max_length: int) -> str:
+    """Truncate text to maximum length.
+
+    Args:
+        text: Text to truncate.
+        max_length: Maximum length.
+
+    Returns:
+        Truncated text.
+    """
+    if len(text) <= max_length:
+        return text
+    return text[: max_length - 3] + "..."
+
 
 class SlackDelivery(BaseDelivery):
     """Delivers reports to Slack users via Bot DM."""
 
     SLACK_API_URL = "https://slack.com/api/chat.postMessage"
 
-    def __init__(self, bot_token: str, user_ids: list[str]):
+    def __init__(self, bot_token: str, user_ids: list[str], max_concurrent: int = 16):
         """Initialize Slack Bot delivery.
 
         Args:
             bot_token: Slack Bot OAuth token (xoxb-...).
             user_ids: List of Slack user IDs to send DMs to.
+            max_concurrent: Maximum number of DMs sent at once. Concurrency
+                backs off below this while Slack answers with 429s.
         """
         if not bot_token:
             raise DeliveryError("Slack Bot token is required")
@@ -26,6 +54,9 @@ class SlackDelivery(BaseDelivery):
 
         self._bot_token = bot_token
         self._user_ids = user_ids
+        # Kept across deliver() calls so the learned send rate carries over
+        self._limiter = AIMDLimiter(initial=max_concurrent, max_limit=max_concurrent)
+        self._client: httpx.AsyncClient | None = None
 
     @property
     def name(self) -> str:
@@ -40,39 +71,23 @@ class SlackDelivery(BaseDelivery):
         Returns:
             True if messages were sent successfully.
         """
-        blocks = self._format_blocks(report)
-        headers = {
-            "Authorization": f"Bearer {self._bot_token}",
-            "Content-Type": "application/json",
-        }
-
-        success_count = 0
-        errors = []
-
-        async with httpx.AsyncClient() as client:
-            for user_id in self._user_ids:
-                payload = {
-                    "channel": user_id,  # User ID for DM
-                    "text": f"{report.title} - {report.date}",
-                    "blocks": blocks,
-                }
-
-                try:
-                    response = await client.post(
-                        self.SLACK_API_URL,
-                        headers=headers,
-                        json=payload,
-                        timeout=30,
-                    )
-                    data = response.json()
-
-                    if data.get("ok"):
-                        success_count += 1
-                    else:
-                        errors.append(f"{user_id}: {data.get('error', 'Unknown error')}")
-
-                except httpx.HTTPError as e:
-                    errors.append(f"{user_id}: {e}")
+        # Everything but the channel is shared, so serialize it only once.
+        # The view skips the opening brace without copying the body.
+        message = orjson.dumps(
+            {
+                "text": f"{report.title} - {report.date}",
+                "blocks": self._format_blocks(report),
+            }
+        )
+        message_fields = memoryview(message)[1:]
+
+        client = self._get_client()
+        results = await asyncio.gather(
+            *(self._send_dm(client, user_id, message_fields) for user_id in self._user_ids)
+        )
+
+        errors = [error for error in results if error is not None]
+        success_count = len(results) - len(errors)
 
         if errors:
             error_msg = "; ".join(errors)
@@ -83,6 +98,73 @@ class SlackDelivery(BaseDelivery):
 
         return success_count > 0
 
+    async def close(self) -> None:
+        """Close the HTTP client if one is open."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for the Slack API, creating it on first use.
+
+        Returns:
+            Client with Slack auth headers and a keep-alive connection pool.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                headers={
+                    "Authorization": f"Bearer {self._bot_token}",
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def _send_dm(
+        self,
+        client: httpx.AsyncClient,
+        user_id: str,
+        message_fields: memoryview,
+    ) -> str | None:
+        """Send the report DM to one user.
+
+        Args:
+            client: HTTP client with Slack auth headers.
+            user_id: Slack user ID to send to.
+            message_fields: Serialized message object without its opening brace.
+
+        Returns:
+            None on success, otherwise an error message for the user.
+        """
+        # Prepend the DM channel (user ID) to the pre-serialized message,
+        # copying the shared fields once into the payload
+        payload = b"".join((b'{"channel":', orjson.dumps(user_id), b",", message_fields))
+
+        async def post() -> httpx.Response:
+            response = await client.post(self.SLACK_API_URL, content=payload)
+            # Rate limits and server errors are retried; other statuses carry
+            # a JSON error body handled below
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
+        try:
+            response = await with_backoff(post, limiter=self._limiter)
+        except httpx.HTTPError as e:
+            return f"{user_id}: {e}"
+
+        # Parse the raw body directly; skips httpx's decode to str + json.loads
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return f"{user_id}: HTTP {response.status_code} with non-JSON response"
+
+        if data.get("ok"):
+            return None
+        return f"{user_id}: {data.get('error', 'Unknown error')}"
+
     def _format_blocks(self, report: Report) -> list[dict]:
         """Format report as Slack blocks.
 
@@ -110,33 +192,28 @@ class SlackDelivery(BaseDelivery):
                     }
                 ],
             },
-            {"type": "divider"},
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": self._truncate_text(report.summary, 2900),
-                },
-            },
-            {"type": "divider"},
+            _DIVIDER_BLOCK,
             {
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": "*Top Sources:*",
+                    "text": _truncate_text(report.summary, 2900),
                 },
             },
+            _DIVIDER_BLOCK,
+            _TOP_SOURCES_BLOCK,
         ]
 
         # Add top articles with images
         for article in report.articles[:5]:
+            title = _truncate_text(article.title, 100)
             if article.image_url:
                 blocks.append(
                     {
                         "type": "section",
                         "text": {
                             "type": "mrkdwn",
-                            "text": f"*<{article.url}|{self._truncate_text(article.title, 100)}>*\n_{article.source}_",
+                            "text": f"*<{article.url}|{title}>*\n_{article.source}_",
                         },
                         "accessory": {
                             "type": "image",
@@ -151,23 +228,9 @@ class SlackDelivery(BaseDelivery):
                         "type": "section",
                         "text": {
                             "type": "mrkdwn",
-                            "text": f"• *<{article.url}|{self._truncate_text(article.title, 100)}>* - _{article.source}_",
+                            "text": f"• *<{article.url}|{title}>* - _{article.source}_",
                         },
                     }
                 )
 
         return blocks
-
-    def _truncate_text(self, text: str, max_length: int) -> str:
-        """Truncate text to maximum length.
-
-        Args:
-            text: Text to truncate.
-            max_length: Maximum length.
-
-        Returns:
-            Truncated text.
-        """
-        if len(text) <= max_length:
-            return text
-        return text[: max_length - 3] + "..."
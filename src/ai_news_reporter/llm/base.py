@@ -35,6 +35,7 @@ class BaseLLM(ABC):
         prompt: str | None = None,
         highlight_count: int = 10,
         focus: str = "",
+        summary: str | None = None,
     ) -> str:
         """Generate a full report from collected articles.
 
@@ -44,6 +45,7 @@ class BaseLLM(ABC):
             prompt: Optional custom prompt template.
             highlight_count: Number of articles to feature in Highlight News.
             focus: Optional focus instructions for the report.
+            summary: Executive summary from summarize(). Generated if not given.
 
         Returns:
             Generated report in markdown format.
@@ -56,6 +58,9 @@ class BaseLLM(ABC):
         """Get the provider name."""
         pass
 
+    async def close(self) -> None:
+        """Release resources such as open connections. No-op by default."""
+
     def _format_articles_for_context(self, articles: list[Article]) -> str:
         """Format articles as context for LLM.
 
@@ -65,19 +70,23 @@ class BaseLLM(ABC):
         Returns:
             Formatted string of articles.
         """
-        formatted = []
+        parts = []
         for i, article in enumerate(articles, 1):
-            image_line = ""
+            # Entries are separated by a blank line (each also ends with "\n")
+            parts.append("\n\n### Article " if i > 1 else "\n### Article ")
+            parts.append(str(i))
+            parts.append(": ")
+            parts.append(article.title)
+            parts.append("\n- **Source**: ")
+            parts.append(article.source)
+            parts.append("\n- **URL**: ")
+            parts.append(article.url_str)
+            parts.append("\n")
             if article.image_url:
-                image_line = f"- **Image**: {article.image_url}\n"
-
-            entry = f"""
-### Article {i}: {article.title}
-- **Source**: {article.source}
-- **URL**: {article.url}
-{image_line}- **Published**: {article.published_at or 'Unknown'}
-
-{article.content}
-"""
-            formatted.append(entry)
-        return "\n".join(formatted)
+                parts.append(f"- **Image**: {article.image_url}\n")
+            parts.append("- **Published**: ")
+            parts.append(str(article.published_at or "Unknown"))
+            parts.append("\n\n")
+            parts.append(article.content)
+            parts.append("\n")
+        return "".join(parts)
@@ -15,6 +15,9 @@ def create_llm(
 ) -> BaseLLM:
     """Create an LLM instance based on provider.
 
+    The instance holds an open API client; call its close() method once
+    it is no longer needed.
+
     Args:
         provider: LLM provider name (claude, openai).
         api_key: API key for the provider.
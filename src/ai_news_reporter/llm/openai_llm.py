@@ -2,7 +2,7 @@
 
 import re
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from ..core.exceptions import LLMError
 from ..models.article import Article
@@ -24,6 +24,25 @@ Here are the articles to analyze:
 {articles}
 """
 
+# The default prompt with the focus line already resolved, so summarize()
+# only has to substitute the articles (and the focus text, if any)
+_PROMPT_NO_FOCUS = DEFAULT_SUMMARY_PROMPT.replace("{focus}", "")
+_PROMPT_WITH_FOCUS = DEFAULT_SUMMARY_PROMPT.replace("{focus}", "\nFOCUS: {focus}\n")
+
+
+# Lines to drop from a summary, in order: markdown headers, "Executive Summary"
+# style titles, images, numbered list items (1. **Title**: ...), source lines
+_SKIP_LINE_RE = re.compile(
+    r'#{1,6}\s'
+    r'|(?i:\*{0,2}(?:Executive Summary|Key Developments|Industry Impact|Trends to Watch'
+    r'|Weekly.*Report)\*{0,2}\s*$)'
+    r'|!\['
+    r'|\d+\.\s+\*\*'
+    r'|\*Source:'
+)
+_MD_HEADER_RE = re.compile(r'#{1,6}\s+')
+_BULLET_RE = re.compile(r'^\*\s+', re.MULTILINE)
+
 
 class OpenAILLM(BaseLLM):
     """OpenAI LLM provider."""
@@ -46,7 +65,7 @@ class OpenAILLM(BaseLLM):
         if not api_key:
             raise LLMError("OpenAI API key is required")
 
-        self._client = OpenAI(api_key=api_key)
+        self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
         self._max_tokens = max_tokens
         self._temperature = temperature
@@ -55,6 +74,10 @@ class OpenAILLM(BaseLLM):
     def provider_name(self) -> str:
         return "OpenAI"
 
+    async def close(self) -> None:
+        """Close the API client and its connection pool."""
+        await self._client.close()
+
     async def summarize(
         self,
         articles: list[Article],
@@ -75,13 +98,16 @@ class OpenAILLM(BaseLLM):
             return "No articles to summarize."
 
         context = self._format_articles_for_context(articles)
-        focus_text = f"\nFOCUS: {focus}\n" if focus else ""
-        full_prompt = (prompt or DEFAULT_SUMMARY_PROMPT).format(
-            articles=context, focus=focus_text
-        )
+        if prompt:
+            focus_text = f"\nFOCUS: {focus}\n" if focus else ""
+            full_prompt = prompt.format(articles=context, focus=focus_text)
+        elif focus:
+            full_prompt = _PROMPT_WITH_FOCUS.format(articles=context, focus=focus)
+        else:
+            full_prompt = _PROMPT_NO_FOCUS.format(articles=context)
 
         try:
-            response = self._client.chat.completions.create(
+            response = await self._client.chat.completions.create(
                 model=self._model,
                 max_tokens=self._max_tokens,
                 temperature=self._temperature,
@@ -98,40 +124,24 @@ class OpenAILLM(BaseLLM):
 
         Keep only the first paragraph (2-3 sentences max).
         """
-        lines = summary.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Skip lines that are markdown headers
-            if re.match(r'^#{1,6}\s', line):
-                continue
-            # Skip lines that are just "Executive Summary" or similar titles
-            if re.match(r'^\*{0,2}(Executive Summary|Key Developments|Industry Impact|Trends to Watch|Weekly.*Report)\*{0,2}\s*$', line, re.IGNORECASE):
-                continue
-            # Skip image lines
-            if re.match(r'^!\[', line):
-                continue
-            # Skip numbered list items (1. **Title**: ...)
-            if re.match(r'^\d+\.\s+\*\*', line):
-                continue
-            # Skip lines that are just source references
-            if re.match(r'^\*Source:', line):
-                continue
-            cleaned_lines.append(line)
-
-        # Join and remove multiple consecutive blank lines
-        result = '\n'.join(cleaned_lines)
-        result = re.sub(r'\n{3,}', '\n\n', result)
-        result = result.strip()
-
-        # Keep only first paragraph (should be 2-3 sentences)
-        paragraphs = [p.strip() for p in result.split('\n\n') if p.strip()]
-        if paragraphs:
-            # Return only the first substantial paragraph, max 600 chars
-            first = paragraphs[0]
-            if len(first) > 600:
-                first = first[:600].rsplit('.', 1)[0] + '.'
-            return first
-        return result
+        # Single pass: drop skipped lines and stop at the end of the first
+        # paragraph with text (paragraphs are separated by empty lines)
+        paragraph: list[str] = []
+        has_text = False
+        for line in summary.split('\n'):
+            if not line:
+                if has_text:
+                    break
+                paragraph.clear()
+            elif not _SKIP_LINE_RE.match(line):
+                paragraph.append(line)
+                has_text = has_text or not line.isspace()
+
+        first = '\n'.join(paragraph).strip() if has_text else ''
+        # Return only the first substantial paragraph, max 600 chars
+        if len(first) > 600:
+            first = first[:600].rsplit('.', 1)[0] + '.'
+        return first
 
     async def generate_report(
         self,
@@ -140,6 +150,7 @@ class OpenAILLM(BaseLLM):
         prompt: str | None = None,
         highlight_count: int = 10,
         focus: str = "",
+        summary: str | None = None,
     ) -> str:
         """Generate a full report using OpenAI.
 
@@ -149,17 +160,20 @@ class OpenAILLM(BaseLLM):
             prompt: Optional custom prompt.
             highlight_count: Number of articles to feature in Highlight News.
             focus: Optional focus instructions for the report.
+            summary: Executive summary from summarize(). Generated if not given.
 
         Returns:
             Generated report in markdown.
         """
-        summary = await self.summarize(articles, prompt, focus)
+        if summary is None:
+            summary = await self.summarize(articles, prompt, focus)
 
         # Split articles into highlights and related
         highlight_articles = articles[:highlight_count]
         related_articles = articles[highlight_count:]
 
-        report = f"""# {title}
+        parts = [
+            f"""# {title}
 
 *Generated by AI News Reporter using {self.provider_name}*
 
@@ -174,34 +188,38 @@ class OpenAILLM(BaseLLM):
 ## 2. Highlight News
 
 """
+        ]
+        append = parts.append
+        clean = self._clean_article_content
+
         # Highlight news with images (normal text, no ### headers)
         for i, article in enumerate(highlight_articles, 1):
-            report += f"**2.{i}.** [{article.title}]({article.url})\n\n"
+            article_title = article.title
+            append(f"**2.{i}.** [{article_title}]({article.url})\n\n")
             if article.image_url:
-                report += f"![{article.title}]({article.image_url})\n\n"
-            clean_content = self._clean_article_content(article.content)
-            report += f"{clean_content}\n\n"
-            report += f"*Source: {article.source}*"
-            if article.published_at:
-                report += f" | *Published: {article.published_at.strftime('%Y-%m-%d')}*"
-            report += "\n\n---\n\n"
+                append(f"![{article_title}]({article.image_url})\n\n")
+            append(f"{clean(article.content)}\n\n*Source: {article.source}*")
+            if published_at := article.published_at:
+                append(f" | *Published: {published_at:%Y-%m-%d}*")
+            append("\n\n---\n\n")
 
         # Related news (citations) without images
         if related_articles:
-            report += "## 3. Related News\n\n"
+            append("## 3. Related News\n\n")
             for i, article in enumerate(related_articles, 1):
-                report += f"**3.{i}.** [{article.title}]({article.url})"
-                if article.published_at:
-                    report += f" ({article.published_at.strftime('%Y-%m-%d')})"
-                clean_content = self._clean_article_content(article.content[:200])
-                report += f"\n\n{clean_content}{'...' if len(article.content) > 200 else ''}\n\n"
+                append(f"**3.{i}.** [{article.title}]({article.url})")
+                if published_at := article.published_at:
+                    append(f" ({published_at:%Y-%m-%d})")
+                content = article.content
+                ellipsis = "..." if len(content) > 200 else ""
+                append(f"\n\n{clean(content[:200])}{ellipsis}\n\n")
 
-        return report
+        return "".join(parts)
 
     def _clean_article_content(self, content: str) -> str:
         """Remove all markdown headers and formatting from article content."""
         # Remove markdown headers anywhere (# ## ### etc followed by space)
-        content = re.sub(r'#{1,6}\s+', '', content)
+        content = _MD_HEADER_RE.sub('', content)
         # Remove standalone * bullets
-        content = re.sub(r'^\*\s+', '', content, flags=re.MULTILINE)
+        content = _BULLET_RE.sub('', content)
         return content.strip()
@@ -1,6 +1,7 @@
 """CLI entry point for AI News Reporter."""
 
 import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import typer
@@ -9,10 +10,12 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .collectors import TavilyCollector, WebScraper
-from .core.config import AppConfig, Settings
+from .core.config import AppConfig, Settings, get_settings
 from .core.exceptions import AINewsReporterError
+from .core.http_client import close_client
 from .delivery import EmailDelivery, FileDelivery, SlackDelivery
 from .llm import create_llm
+from .models import Article
 from .processors import Deduplicator, Summarizer
 from .scheduler import ReportScheduler
 
@@ -23,55 +26,198 @@ app = typer.Typer(
 console = Console()
 
 
-async def run_report_async(settings: Settings, config: AppConfig) -> None:
-    """Run report generation asynchronously."""
-    all_articles = []
+class _Deliveries:
+    """Email and Slack deliveries, created on first use and kept open.
 
+    The scheduler keeps one instance for its lifetime, so the SMTP
+    connection, the Slack HTTP client and its learned send rate carry over
+    between runs.
+    """
+
+    def __init__(self, settings: Settings, config: AppConfig):
+        self._settings = settings
+        self._config = config
+        self._email: EmailDelivery | None = None
+        self._slack: SlackDelivery | None = None
+
+    def email(self) -> EmailDelivery:
+        """Get the email delivery, creating it on first use."""
+        if self._email is None:
+            settings = self._settings
+            delivery = self._config.delivery
+            self._email = EmailDelivery(
+                host=settings.smtp_host,
+                port=settings.smtp_port,
+                user=settings.smtp_user,
+                password=settings.smtp_password,
+                recipients=delivery.email_recipients,
+                subject_prefix=delivery.email_subject_prefix,
+            )
+        return self._email
+
+    def slack(self) -> SlackDelivery:
+        """Get the Slack delivery, creating it on first use.
+
+        Raises:
+            DeliveryError: If the Slack configuration is invalid.
+        """
+        if self._slack is None:
+            self._slack = SlackDelivery(
+                bot_token=self._settings.slack_bot_token,
+                user_ids=self._config.delivery.slack_user_ids,
+            )
+        return self._slack
+
+    async def close(self) -> None:
+        """Close the deliveries' open connections."""
+        for delivery in (self._email, self._slack):
+            if delivery is not None:
+                await delivery.close()
+        self._email = None
+        self._slack = None
+
+
+async def run_report_async(
+    settings: Settings,
+    config: AppConfig,
+    deliveries: _Deliveries | None = None,
+) -> None:
+    """Run report generation asynchronously.
+
+    Args:
+        settings: Application settings.
+        config: Application configuration.
+        deliveries: Deliveries to reuse across runs; the caller closes them.
+            Defaults to deliveries opened and closed for this run only.
+    """
+    own_deliveries = deliveries is None
+    if deliveries is None:
+        deliveries = _Deliveries(settings, config)
+    try:
+        await _generate_and_deliver(settings, config, deliveries)
+    finally:
+        await close_client()
+        if own_deliveries:
+            await deliveries.close()
+
+
+async def _stream_tavily(
+    settings: Settings, config: AppConfig, progress: Progress
+) -> AsyncIterator[Article]:
+    """Search news for every configured keyword with Tavily.
+
+    Yields each keyword's articles as soon as its search finishes.
+    """
+    if not (config.search.enabled and settings.tavily_api_key):
+        return
+
+    task = progress.add_task("Searching news with Tavily...", total=None)
+    try:
+        collector = TavilyCollector(settings.tavily_api_key)
+    except AINewsReporterError as e:
+        console.print(f"[yellow]Tavily search failed: {e}[/yellow]")
+        return
+
+    semaphore = asyncio.Semaphore(config.search.max_concurrency)
+
+    async def search(keyword: str) -> list[Article]:
+        async with semaphore:
+            try:
+                return await collector.collect(
+                    query=keyword,
+                    time_range=config.search.time_range,
+                    max_results=config.search.max_results_per_keyword,
+                    include_domains=config.search.include_domains or None,
+                    exclude_domains=config.search.exclude_domains or None,
+                )
+            except AINewsReporterError as e:
+                console.print(f"[yellow]Tavily search failed for '{keyword}': {e}[/yellow]")
+                return []
+
+    tasks = [asyncio.create_task(search(keyword)) for keyword in config.keywords]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for article in await next_done:
+                yield article
+    finally:
+        for pending in tasks:
+            pending.cancel()
+    progress.update(task, completed=True)
+
+
+async def _stream_sites(config: AppConfig, progress: Progress) -> AsyncIterator[Article]:
+    """Scrape articles from the enabled configured sites, yielding them per site."""
+    sites = [s for s in config.sites if s.enabled]
+    if not sites:
+        return
+
+    task = progress.add_task("Scraping configured sites...", total=None)
+    scraper = WebScraper(max_concurrency=config.search.max_concurrency)
+    async for article in scraper.stream_from_sites(sites):
+        yield article
+    progress.update(task, completed=True)
+
+
+async def _merge(*streams: AsyncIterator[Article]) -> AsyncIterator[Article]:
+    """Interleave articles from several streams in the order they arrive.
+
+    An exception raised by any stream is re-raised here, stopping the others.
+    """
+    queue: asyncio.Queue[Article | Exception | None] = asyncio.Queue()
+
+    async def drain(stream: AsyncIterator[Article]) -> None:
+        try:
+            async for article in stream:
+                await queue.put(article)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)  # Stream finished
+
+    tasks = [asyncio.create_task(drain(stream)) for stream in streams]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for pending in tasks:
+            pending.cancel()
+
+
+async def _generate_and_deliver(
+    settings: Settings, config: AppConfig, deliveries: _Deliveries
+) -> None:
+    """Collect articles, generate the report and deliver it."""
+    dedup = Deduplicator() if config.report.deduplicate else None
+    collected_count = 0
+    all_articles: list[Article] = []
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        # Collect from Tavily search
-        if config.search.enabled and settings.tavily_api_key:
-            task = progress.add_task("Searching news with Tavily...", total=None)
-            try:
-                collector = TavilyCollector(settings.tavily_api_key)
-                for keyword in config.keywords:
-                    articles = await collector.collect(
-                        query=keyword,
-                        time_range=config.search.time_range,
-                        max_results=config.search.max_results_per_keyword,
-                        include_domains=config.search.include_domains or None,
-                        exclude_domains=config.search.exclude_domains or None,
-                    )
-                    all_articles.extend(articles)
-                progress.update(task, completed=True)
-            except AINewsReporterError as e:
-                console.print(f"[yellow]Tavily search failed: {e}[/yellow]")
-
-        # Collect from configured sites
-        sites = [s for s in config.sites if s.enabled]
-        if sites:
-            task = progress.add_task("Scraping configured sites...", total=None)
-            try:
-                scraper = WebScraper()
-                site_articles = await scraper.collect_from_sites(sites)
-                all_articles.extend(site_articles)
-                progress.update(task, completed=True)
-            except AINewsReporterError as e:
-                console.print(f"[yellow]Web scraping failed: {e}[/yellow]")
+        # Search and scraping are independent, so run them at the same time and
+        # deduplicate articles as they arrive instead of after collection
+        async for article in _merge(
+            _stream_tavily(settings, config, progress),
+            _stream_sites(config, progress),
+        ):
+            collected_count += 1
+            if dedup is None or dedup.add(article) is not None:
+                all_articles.append(article)
 
     if not all_articles:
         console.print("[red]No articles collected. Check your configuration.[/red]")
         raise typer.Exit(1)
 
-    console.print(f"[green]Collected {len(all_articles)} articles[/green]")
-
-    # Deduplicate
-    if config.report.deduplicate:
-        dedup = Deduplicator()
-        all_articles = dedup.deduplicate(all_articles)
+    console.print(f"[green]Collected {collected_count} articles[/green]")
+    if dedup is not None:
         console.print(f"[green]After deduplication: {len(all_articles)} articles[/green]")
 
     # Limit articles
@@ -102,15 +248,26 @@ async def run_report_async(settings: Settings, config: AppConfig) -> None:
             temperature=config.llm.temperature,
         )
 
+        # Only render the formats some delivery method will use
+        formats: set[str] = set()
+        if config.delivery.email_enabled:
+            formats.update(("html", "text"))
+        if config.delivery.file_enabled:
+            formats.update(config.delivery.file_formats)
+
         summarizer = Summarizer(llm)
-        report = await summarizer.generate_report(
-            articles=all_articles,
-            title=config.report.title,
-            prompt=config.llm.summary_prompt,
-            recipients=config.delivery.email_recipients,
-            highlight_count=config.report.highlight_count,
-            focus=config.report.focus,
-        )
+        try:
+            report = await summarizer.generate_report(
+                articles=all_articles,
+                title=config.report.title,
+                prompt=config.llm.summary_prompt,
+                recipients=config.delivery.email_recipients,
+                highlight_count=config.report.highlight_count,
+                focus=config.report.focus,
+                formats=formats,
+            )
+        finally:
+            await llm.close()
         progress.update(task, completed=True)
 
     console.print(f"[green]Report generated: {report.title}[/green]")
@@ -136,15 +293,7 @@ async def run_report_async(settings: Settings, config: AppConfig) -> None:
     # Email delivery
     if config.delivery.email_enabled:
         try:
-            email_delivery = EmailDelivery(
-                host=settings.smtp_host,
-                port=settings.smtp_port,
-                user=settings.smtp_user,
-                password=settings.smtp_password,
-                recipients=config.delivery.email_recipients,
-                subject_prefix=config.delivery.email_subject_prefix,
-            )
-            await email_delivery.deliver(report)
+            await deliveries.email().deliver(report)
             console.print("[green]Report sent via email[/green]")
             delivery_count += 1
         except AINewsReporterError as e:
@@ -153,11 +302,7 @@ async def run_report_async(settings: Settings, config: AppConfig) -> None:
     # Slack delivery
     if config.delivery.slack_enabled and settings.slack_bot_token:
         try:
-            slack_delivery = SlackDelivery(
-                bot_token=settings.slack_bot_token,
-                user_ids=config.delivery.slack_user_ids,
-            )
-            await slack_delivery.deliver(report)
+            await deliveries.slack().deliver(report)
             console.print("[green]Report sent to Slack[/green]")
             delivery_count += 1
         except AINewsReporterError as e:
@@ -186,7 +331,7 @@ def run(
     )
 
     try:
-        settings = Settings()
+        settings = get_settings()
         config = AppConfig(config_path)
     except Exception as e:
         console.print(f"[red]Configuration error: {e}[/red]")
@@ -219,7 +364,7 @@ def schedule(
     )
 
     try:
-        settings = Settings()
+        settings = get_settings()
         config = AppConfig(config_path)
     except Exception as e:
         console.print(f"[red]Configuration error: {e}[/red]")
@@ -236,14 +381,18 @@ def schedule(
         f"({schedule_config.timezone})[/green]"
     )
 
-    def job():
-        asyncio.run(run_report_async(settings, config))
+    # Shared by every run and closed when the scheduler stops
+    deliveries = _Deliveries(settings, config)
+
+    async def job():
+        # Runs on the scheduler's event loop
+        await run_report_async(settings, config, deliveries)
 
     scheduler = ReportScheduler(timezone=schedule_config.timezone)
     scheduler.schedule_from_config(schedule_config, job)
 
     console.print("[green]Scheduler started. Press Ctrl+C to stop.[/green]")
-    scheduler.run_forever()
+    scheduler.run_forever(on_stop=deliveries.close)
 
 
 @app.command()
@@ -260,7 +409,7 @@ def validate(
 
     # Check .env
     try:
-        settings = Settings()
+        settings = get_settings()
         console.print("[green]✓ config/.env loaded[/green]")
 
         if settings.anthropic_api_key:
@@ -2,12 +2,15 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr
 
 
 class Article(BaseModel):
     """Represents a collected news article."""
 
+    # Not frozen: collectors fill in fields such as image_url after creation
+    model_config = ConfigDict(extra="ignore")
+
     title: str
     url: HttpUrl
     content: str
@@ -15,16 +18,37 @@ class Article(BaseModel):
     source: str
     image_url: str | None = None
     published_at: datetime | None = None
-    collected_at: datetime = datetime.now()
-    keywords: list[str] = []
+    collected_at: datetime = Field(default_factory=datetime.now)
+    keywords: list[str] = Field(default_factory=list)
     score: float | None = None
 
+    # (url object, its string form); rebuilt whenever url is replaced
+    _url_str_cache: tuple[object, str] | None = PrivateAttr(default=None)
+
+    @property
+    def url_str(self) -> str:
+        """Get the URL as a string, serialized once per URL value.
+
+        The cache is keyed on the url object itself, so reassigning url or
+        copying with model_copy(update={"url": ...}) never serves a stale
+        string.
+        """
+        cache = self._url_str_cache
+        if cache is None or cache[0] is not self.url:
+            cache = (self.url, str(self.url))
+            self._url_str_cache = cache
+        return cache[1]
+
     def __hash__(self) -> int:
-        """Hash based on URL for deduplication."""
-        return hash(str(self.url))
+        """Hash based on URL for deduplication.
+
+        url_str is cached per URL and str caches its own hash, so repeated
+        hashing (sets, dict keys) does no further work.
+        """
+        return hash(self.url_str)
 
     def __eq__(self, other: object) -> bool:
         """Equality based on URL."""
         if not isinstance(other, Article):
             return False
-        return str(self.url) == str(other.url)
+        return self.url_str == other.url_str
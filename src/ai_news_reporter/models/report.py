@@ -2,7 +2,7 @@
 
 from datetime import date
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from .article import Article
 
@@ -10,6 +10,8 @@ from .article import Article
 class Report(BaseModel):
     """Represents a generated news report."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     title: str
     date: date
     articles: list[Article]
@@ -17,7 +19,7 @@ class Report(BaseModel):
     content_markdown: str
     content_html: str = ""
     content_text: str = ""
-    recipients: list[str] = []
+    recipients: list[str] = Field(default_factory=list)
 
     @property
     def article_count(self) -> int:
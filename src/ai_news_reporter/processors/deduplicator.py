@@ -1,12 +1,45 @@
 """Article deduplication processor."""
 
 from difflib import SequenceMatcher
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from ..models.article import Article
 
 
+def _normalize_url(url: str) -> str:
+    """Normalize a URL so trivial variants of the same page compare equal.
+
+    Lowercases the scheme and host, drops the fragment, a trailing slash and
+    utm_* tracking parameters.
+
+    Args:
+        url: Absolute URL.
+
+    Returns:
+        Normalized URL.
+    """
+    parts = urlsplit(url)
+    query = parts.query
+    if "utm_" in query:
+        query = urlencode(
+            [
+                (key, value)
+                for key, value in parse_qsl(query, keep_blank_values=True)
+                if not key.startswith("utm_")
+            ]
+        )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, "")
+    )
+
+
 class Deduplicator:
-    """Removes duplicate articles based on URL and title similarity."""
+    """Removes duplicate articles based on URL and title similarity.
+
+    Articles can be deduplicated as a batch with deduplicate(), or one at a
+    time as they are collected with add(), which keeps the articles seen so
+    far.
+    """
 
     def __init__(self, title_similarity_threshold: float = 0.8):
         """Initialize deduplicator.
@@ -16,58 +49,73 @@ class Deduplicator:
                 to be considered duplicates (0.0 to 1.0).
         """
         self._threshold = title_similarity_threshold
+        self._seen_urls: set[str] = set()  # normalized
+        self._seen_titles: list[str] = []  # lowercased
 
-    def deduplicate(self, articles: list[Article]) -> list[Article]:
-        """Remove duplicate articles.
+    def add(self, article: Article) -> Article | None:
+        """Check an article against the articles added so far.
 
         Deduplication is based on:
-        1. Exact URL match
+        1. URL match (after normalization)
         2. High title similarity
 
         Args:
-            articles: List of articles to deduplicate.
+            article: Article to add.
 
         Returns:
-            List of unique articles.
+            The article if it is unique, otherwise None.
         """
-        if not articles:
-            return []
-
-        seen_urls: set[str] = set()
-        seen_titles: list[str] = []
-        unique_articles: list[Article] = []
+        url = _normalize_url(article.url_str)
+        if url in self._seen_urls:
+            return None
+        # Remembered even if the title turns out to be a duplicate, so later
+        # copies of this URL are dropped without comparing titles
+        self._seen_urls.add(url)
+
+        # Check title similarity
+        title_lower = article.title.lower()
+        if self._is_similar_to_existing(title_lower, self._seen_titles):
+            return None
+
+        # Article is unique
+        self._seen_titles.append(title_lower)
+        return article
 
-        for article in articles:
-            url_str = str(article.url)
+    def deduplicate(self, articles: list[Article]) -> list[Article]:
+        """Remove duplicate articles, keeping the first occurrence.
 
-            # Check exact URL match
-            if url_str in seen_urls:
-                continue
+        The batch is checked independently of articles passed to add().
 
-            # Check title similarity
-            if self._is_similar_to_existing(article.title, seen_titles):
-                continue
-
-            # Article is unique
-            seen_urls.add(url_str)
-            seen_titles.append(article.title)
-            unique_articles.append(article)
+        Args:
+            articles: List of articles to deduplicate.
 
-        return unique_articles
+        Returns:
+            List of unique articles.
+        """
+        batch = Deduplicator(self._threshold)
+        return [article for article in articles if batch.add(article) is not None]
 
     def _is_similar_to_existing(self, title: str, existing_titles: list[str]) -> bool:
         """Check if title is similar to any existing title.
 
         Args:
-            title: Title to check.
-            existing_titles: List of existing titles.
+            title: Lowercased title to check.
+            existing_titles: List of lowercased existing titles.
 
         Returns:
             True if title is similar to an existing one.
         """
-        title_lower = title.lower()
+        threshold = self._threshold
+        title_len = len(title)
         for existing in existing_titles:
-            ratio = SequenceMatcher(None, title_lower, existing.lower()).ratio()
-            if ratio >= self._threshold:
+            # The ratio can't exceed 2 * min(len) / total len, so pairs with very
+            # different lengths are skipped without running the matcher
+            existing_len = len(existing)
+            total_len = title_len + existing_len
+            if total_len and 2 * min(title_len, existing_len) < threshold * total_len:
+                continue
+            matcher = SequenceMatcher(None, title, existing)
+            # quick_ratio() is a cheap upper bound on ratio()
+            if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
                 return True
         return False
@@ -1,12 +1,98 @@
 """Report generation using LLM."""
 
+from collections.abc import Collection
 from datetime import date
+from typing import Any
+
+import mistune
 
 from ..llm.base import BaseLLM
 from ..models.article import Article
 from ..models.report import Report
 
 
+class _PlainTextRenderer(mistune.HTMLRenderer):
+    """Renders markdown as plain text, keeping only the readable content."""
+
+    def text(self, text: str) -> str:
+        return text
+
+    def emphasis(self, text: str) -> str:
+        return text
+
+    def strong(self, text: str) -> str:
+        return text
+
+    def link(self, text: str, url: str, title: str | None = None) -> str:
+        return text
+
+    def image(self, text: str, url: str, title: str | None = None) -> str:
+        return ""
+
+    def codespan(self, text: str) -> str:
+        return text
+
+    def linebreak(self) -> str:
+        return "\n"
+
+    def inline_html(self, html: str) -> str:
+        return html
+
+    def paragraph(self, text: str) -> str:
+        return text + "\n\n" if text else ""
+
+    def heading(self, text: str, level: int, **attrs: Any) -> str:
+        return text + "\n\n"
+
+    def thematic_break(self) -> str:
+        return ""
+
+    def block_code(self, code: str, info: str | None = None) -> str:
+        return code + "\n"
+
+    def block_quote(self, text: str) -> str:
+        return text
+
+    def block_html(self, html: str) -> str:
+        return html + "\n"
+
+    def block_error(self, text: str) -> str:
+        return text
+
+    def list(self, text: str, ordered: bool, **attrs: Any) -> str:
+        return text + "\n"
+
+    def list_item(self, text: str) -> str:
+        return "- " + text.strip() + "\n"
+
+
+# Parsers are reusable across calls. Raw HTML is passed through, as before.
+_markdown_html = mistune.create_markdown(escape=False)
+_markdown_text = mistune.create_markdown(renderer=_PlainTextRenderer(escape=False))
+
+# HTML page wrapped around the rendered report. Kept as plain strings so the
+# CSS braces need no escaping and nothing is re-parsed per report.
+_HTML_PAGE_START = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+               max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; }
+        h1, h2, h3 { color: #333; }
+        a { color: #0066cc; }
+        li { margin: 8px 0; }
+        hr { border: none; border-top: 1px solid #ddd; margin: 20px 0; }
+        img { max-width: 100%; height: auto; margin: 10px 0; border-radius: 8px; }
+    </style>
+</head>
+<body>
+"""
+_HTML_PAGE_END = """
+</body>
+</html>"""
+
+
 class Summarizer:
     """Generates reports from collected articles using LLM."""
 
@@ -26,6 +112,7 @@ class Summarizer:
         recipients: list[str] | None = None,
         highlight_count: int = 10,
         focus: str = "",
+        formats: Collection[str] | None = None,
     ) -> Report:
         """Generate a complete report from articles.
 
@@ -36,6 +123,8 @@ class Summarizer:
             recipients: Optional list of report recipients.
             highlight_count: Number of articles to feature in Highlight News.
             focus: Optional focus instructions for the report.
+            formats: Output formats needed besides markdown ("html", "text").
+                Formats not listed are left empty. Defaults to all formats.
 
         Returns:
             Generated Report object.
@@ -43,16 +132,21 @@ class Summarizer:
         # Generate summary using LLM
         summary = await self._llm.summarize(articles, prompt, focus)
 
-        # Generate full markdown report
+        # Generate full markdown report around the same summary, so the LLM
+        # is only asked once and the report matches report.summary
         content_markdown = await self._llm.generate_report(
-            articles, title, prompt, highlight_count, focus
+            articles, title, prompt, highlight_count, focus, summary=summary
         )
 
         # Generate plain text version (strip markdown)
-        content_text = self._markdown_to_text(content_markdown)
+        content_text = ""
+        if formats is None or "text" in formats:
+            content_text = self._markdown_to_text(content_markdown)
 
         # Generate HTML version
-        content_html = self._markdown_to_html(content_markdown)
+        content_html = ""
+        if formats is None or "html" in formats:
+            content_html = self._markdown_to_html(content_markdown)
 
         return Report(
             title=title,
@@ -74,16 +168,7 @@ class Summarizer:
         Returns:
             Plain text version.
         """
-        import re
-
-        text = markdown
-        # Remove markdown links, keep text
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-        # Remove markdown formatting
-        text = re.sub(r"[*_`#]+", "", text)
-        # Remove horizontal rules
-        text = re.sub(r"^---+$", "", text, flags=re.MULTILINE)
-        return text.strip()
+        return _markdown_text(markdown).strip()
 
     def _markdown_to_html(self, markdown: str) -> str:
         """Convert markdown to basic HTML.
@@ -94,67 +179,7 @@ class Summarizer:
         Returns:
             HTML version.
         """
-        import re
-
-        html = markdown
-
-        # Convert headers
-        html = re.sub(r"^# (.+)$", r"<h1>\1</h1>", html, flags=re.MULTILINE)
-        html = re.sub(r"^## (.+)$", r"<h2>\1</h2>", html, flags=re.MULTILINE)
-        html = re.sub(r"^### (.+)$", r"<h3>\1</h3>", html, flags=re.MULTILINE)
-
-        # Convert images (must be before links) - handle URLs with special chars
-        html = re.sub(
-            r"!\[([^\]]*)\]\((https?://[^\s)]+)\)",
-            r'<img src="\2" alt="\1" style="max-width: 100%; height: auto; margin: 10px 0;">',
-            html,
-        )
-
-        # Convert bold (must be before italic)
-        html = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", html)
-
-        # Convert links - handle URLs with special chars
-        html = re.sub(
-            r"\[([^\]]+)\]\((https?://[^\s)]+)\)",
-            r'<a href="\2">\1</a>',
-            html,
-        )
-
-        # Convert italic (single * pairs only, not standalone *)
-        html = re.sub(r"(?<!\*)\*([^*\n]+)\*(?!\*)", r"<em>\1</em>", html)
-
-        # Convert bullet points
-        html = re.sub(r"^- (.+)$", r"<li>\1</li>", html, flags=re.MULTILINE)
-
-        # Convert horizontal rules
-        html = re.sub(r"^---+$", "<hr>", html, flags=re.MULTILINE)
-
-        # Wrap in paragraphs (simple approach)
-        lines = html.split("\n")
-        processed = []
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("<"):
-                line = f"<p>{line}</p>"
-            processed.append(line)
+        body = _markdown_html(markdown)
 
         # Wrap in basic HTML structure
-        body = "\n".join(processed)
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-               max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; }}
-        h1, h2, h3 {{ color: #333; }}
-        a {{ color: #0066cc; }}
-        li {{ margin: 8px 0; }}
-        hr {{ border: none; border-top: 1px solid #ddd; margin: 20px 0; }}
-        img {{ max-width: 100%; height: auto; border-radius: 8px; }}
-    </style>
-</head>
-<body>
-{body}
-</body>
-</html>"""
+        return _HTML_PAGE_START + body + _HTML_PAGE_END
@@ -1,7 +1,8 @@
 """Cron-style scheduling using APScheduler."""
 
 import asyncio
-from collections.abc import Callable
+import signal
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -39,27 +40,17 @@ class ReportScheduler:
         # Parse time
         hour, minute = self._parse_time(config.time)
 
+        trigger_kwargs: dict[str, Any] = {
+            "hour": hour,
+            "minute": minute,
+            "timezone": config.timezone or self._timezone,
+        }
         if config.type == "weekly":
-            trigger = CronTrigger(
-                day_of_week=self._day_to_number(config.day_of_week),
-                hour=hour,
-                minute=minute,
-                timezone=config.timezone or self._timezone,
-            )
-        elif config.type == "daily":
-            trigger = CronTrigger(
-                hour=hour,
-                minute=minute,
-                timezone=config.timezone or self._timezone,
-            )
-        else:
-            # Default to weekly
-            trigger = CronTrigger(
-                day_of_week=0,
-                hour=hour,
-                minute=minute,
-                timezone=config.timezone or self._timezone,
-            )
+            trigger_kwargs["day_of_week"] = self._day_to_number(config.day_of_week)
+        elif config.type != "daily":
+            # Default to weekly on Monday
+            trigger_kwargs["day_of_week"] = 0
+        trigger = CronTrigger(**trigger_kwargs)
 
         self._scheduler.add_job(job_func, trigger, id="report_job")
 
@@ -114,13 +105,36 @@ class ReportScheduler:
         """Stop the scheduler."""
         self._scheduler.shutdown()
 
-    def run_forever(self) -> None:
-        """Run scheduler in blocking mode."""
+    def run_forever(self, on_stop: Callable[[], Awaitable[None]] | None = None) -> None:
+        """Run scheduler in blocking mode until SIGINT or SIGTERM.
+
+        Args:
+            on_stop: Optional coroutine function awaited on the scheduler's
+                event loop after it stops, e.g. to close open connections.
+        """
+        asyncio.run(self._run_until_stopped(on_stop))
+
+    async def _run_until_stopped(
+        self, on_stop: Callable[[], Awaitable[None]] | None = None
+    ) -> None:
+        """Run the scheduler on the running event loop until a stop signal.
+
+        The scheduler binds to the loop that is running when it starts, so
+        starting it here keeps it and its jobs on this loop.
+        """
         self.start()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
         try:
-            asyncio.get_event_loop().run_forever()
-        except (KeyboardInterrupt, SystemExit):
+            await stop.wait()
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
             self.stop()
+            if on_stop is not None:
+                await on_stop()
 
     def _day_to_number(self, day: str) -> int:
         """Convert day name to number.
@@ -0,0 +1,29 @@
+"""Tests for the Article model."""
+
+from ai_news_reporter.models.article import Article
+
+
+def _article(url: str) -> Article:
+    return Article(title="Title", url=url, source="Test", content="")
+
+
+class TestArticleUrlStr:
+    """Tests for the cached Article.url_str."""
+
+    def test_follows_url_reassignment(self):
+        """Test that url_str is not stale after url is replaced."""
+        article = _article("https://example.com/a")
+        assert article.url_str == "https://example.com/a"
+
+        article.url = _article("https://example.com/b").url
+        assert article.url_str == "https://example.com/b"
+        assert article == _article("https://example.com/b")
+
+    def test_follows_model_copy_update(self):
+        """Test that model_copy with a new url does not carry the old string."""
+        article = _article("https://example.com/a")
+        assert article.url_str == "https://example.com/a"
+
+        copy = article.model_copy(update={"url": _article("https://example.com/b").url})
+        assert copy.url_str == "https://example.com/b"
+        assert article.url_str == "https://example.com/a"
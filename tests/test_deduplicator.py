@@ -0,0 +1,89 @@
+"""Tests for article deduplication."""
+
+import pytest
+
+from ai_news_reporter.models.article import Article
+from ai_news_reporter.processors.deduplicator import Deduplicator
+
+
+def _article(title: str, url: str) -> Article:
+    return Article(title=title, url=url, source="Test", content="")
+
+
+# Reworded or suffixed title pairs with a SequenceMatcher ratio of at least 0.8
+_NEAR_DUPLICATE_TITLES = [
+    ("Google launches Gemini 2 for developers", "Google unveils Gemini 2 for developers: report"),
+    (
+        "OpenAI releases GPT-5 with better reasoning",
+        "OpenAI launches GPT-5 with better reasoning (update)",
+    ),
+    ("Anthropic raises $4 billion from Amazon", "Anthropic secures $4 billion from Amazon: report"),
+    ("Meta open sources new Llama model", "Meta open sources latest Llama model: report"),
+    ("EU passes landmark AI act", "EU passes landmark AI act today today"),
+]
+
+
+class TestDeduplicator:
+    """Tests for Deduplicator."""
+
+    def test_removes_exact_url_duplicates(self):
+        """Test that a repeated URL is dropped even with a different title."""
+        articles = [
+            _article("OpenAI releases a new model", "https://example.com/a"),
+            _article("Completely different headline", "https://example.com/a"),
+        ]
+        assert Deduplicator().deduplicate(articles) == articles[:1]
+
+    def test_removes_url_variants(self):
+        """Test that tracking parameters, fragments and trailing slashes are ignored."""
+        articles = [
+            _article("OpenAI releases a new model", "https://Example.com/news/a?id=1"),
+            _article("Different title", "https://example.com/news/a/?id=1&utm_source=x#top"),
+            _article("Another story", "https://example.com/news/a?id=2"),
+        ]
+        assert Deduplicator().deduplicate(articles) == [articles[0], articles[2]]
+
+    def test_removes_similar_titles(self):
+        """Test that near-identical titles from different URLs are dropped."""
+        articles = [
+            _article("OpenAI releases GPT-5 with better reasoning", "https://example.com/a"),
+            _article("OpenAI Releases GPT-5 With Better Reasoning - Reuters", "https://b.com/x"),
+            _article("Nvidia reports record data center revenue", "https://example.com/c"),
+        ]
+        result = Deduplicator().deduplicate(articles)
+        assert [str(a.url) for a in result] == ["https://example.com/a", "https://example.com/c"]
+
+    def test_keeps_distinct_titles_in_order(self):
+        """Test that unrelated articles are all kept in their original order."""
+        titles = [
+            "OpenAI releases GPT-5 with better reasoning",
+            "Nvidia reports record data center revenue",
+            "EU finalizes rules for general-purpose AI models",
+            "Google DeepMind unveils a weather forecasting system",
+            "Startup raises $100M to build humanoid robots",
+        ]
+        articles = [_article(title, f"https://example.com/{i}") for i, title in enumerate(titles)]
+        assert Deduplicator().deduplicate(articles) == articles
+
+    def test_add_checks_against_previously_added_articles(self):
+        """Test that add() returns unique articles and None for duplicates."""
+        dedup = Deduplicator()
+        first = _article("OpenAI releases GPT-5 with better reasoning", "https://example.com/a")
+        assert dedup.add(first) is first
+        assert dedup.add(_article("Other", "https://example.com/a/")) is None
+        assert (
+            dedup.add(_article("OpenAI Releases GPT-5 With Better Reasoning", "https://b.com/x"))
+            is None
+        )
+        other = _article("Nvidia reports record data center revenue", "https://example.com/c")
+        assert dedup.add(other) is other
+        # Batches are independent of what was added
+        assert dedup.deduplicate([first]) == [first]
+
+    @pytest.mark.parametrize(("title", "duplicate"), _NEAR_DUPLICATE_TITLES)
+    def test_removes_near_duplicates(self, title, duplicate):
+        """Test that reworded or suffixed titles are recognized as duplicates."""
+        dedup = Deduplicator()
+        first = _article(title, "https://example.com/a")
+        assert dedup.add(first) is first
+        assert dedup.add(_article(duplicate, "https://b.com/x")) is None
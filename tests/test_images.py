@@ -1,37 +1,150 @@
 """Tests for image extraction and inclusion in reports."""
 
-import asyncio
+import re
+import socket
+
+import httpx
 import pytest
+import pytest_asyncio
 
-from ai_news_reporter.collectors.image_extractor import extract_og_image
+from ai_news_reporter.collectors import image_extractor
+from ai_news_reporter.collectors.image_extractor import (
+    _find_image,
+    clear_image_cache,
+    extract_og_image,
+)
+from ai_news_reporter.core.http_client import close_client
+from ai_news_reporter.llm.claude import ClaudeLLM
 from ai_news_reporter.models.article import Article
 
+# Canned pages served by the mocked client; other hosts fail DNS resolution
+_PAGES = {
+    "https://news.example.com/": (
+        b"<html><head><title>News</title>"
+        b'<meta property="og:image" content="https://news.example.com/cover.jpg">'
+        b"</head><body><p>Story</p></body></html>"
+    ),
+    "https://plain.example.com/": (
+        b"<html><head><title>Plain</title></head><body><p>No images here</p></body></html>"
+    ),
+}
+
+# Image markdown of the "Article N" / "Test Article N" test articles: (N, image URL)
+_ARTICLE_IMAGE_RE = re.compile(r"!\[(?:Test )?Article (\d+)\]\(([^)]*)\)")
+
+# URLs requested from the mocked client, in order
+_requested: list[str] = []
+
+
+@pytest.fixture(autouse=True)
+def _isolate_image_cache():
+    """Start each test with no cached og:image lookups."""
+    clear_image_cache()
+    _requested.clear()
+    yield
+    clear_image_cache()
+
+
+def _serve_page(request: httpx.Request) -> httpx.Response:
+    _requested.append(str(request.url))
+    page = _PAGES.get(str(request.url))
+    if page is None:
+        # What httpx raises when the resolver reports an unknown host
+        error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        raise httpx.ConnectError(str(error), request=request) from error
+    return httpx.Response(
+        200, content=page, headers={"Content-Type": "text/html; charset=utf-8"}
+    )
+
+
+@pytest_asyncio.fixture
+async def mock_client(monkeypatch):
+    """Serve _PAGES to extract_og_image instead of accessing the network."""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_serve_page)) as client:
+
+        async def get_mock_client():
+            return client
+
+        monkeypatch.setattr(image_extractor, "get_client", get_mock_client)
+        yield client
+
 
 class TestImageExtractor:
     """Tests for image extraction from URLs."""
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://news.example.com/", "https://news.example.com/cover.jpg"),
+            # Pages without images and hosts that don't resolve give None, not errors
+            ("https://plain.example.com/", None),
+            ("https://this-domain-does-not-exist-12345.com/", None),
+        ],
+        ids=["og_image", "no_images", "invalid_url"],
+    )
+    @pytest.mark.asyncio
+    async def test_extract_og_image(self, mock_client, url, expected):
+        """Test extracting og:image from a page."""
+        assert await extract_og_image(url) == expected
+
+    @pytest.mark.asyncio
+    async def test_extract_og_image_caches_results(self, mock_client):
+        """Test that a repeated URL is served from the cache, unlike failures."""
+        image = await extract_og_image("https://news.example.com/")
+        assert await extract_og_image("https://news.example.com/") == image
+        assert _requested == ["https://news.example.com/"]
+
+        url = "https://this-domain-does-not-exist-12345.com/"
+        await extract_og_image(url)
+        await extract_og_image(url)
+        assert _requested.count(url) == 2
+
+    # Live requests stay on one worker under `pytest -n auto --dist loadgroup`
+    @pytest.mark.network
+    @pytest.mark.xdist_group(name="network_io")
     @pytest.mark.asyncio
     async def test_extract_og_image_from_techcrunch(self):
         """Test extracting og:image from a real news site."""
-        # TechCrunch should have og:image
-        url = "https://techcrunch.com/"
-        image = await extract_og_image(url)
+        try:
+            image = await extract_og_image("https://techcrunch.com/")
+        finally:
+            await close_client()
         # Should return a URL string or None
         assert image is None or image.startswith("http")
 
-    @pytest.mark.asyncio
-    async def test_extract_og_image_returns_string_or_none(self):
-        """Test that extract_og_image returns string or None."""
-        url = "https://www.google.com/"
-        image = await extract_og_image(url)
-        assert image is None or isinstance(image, str)
 
-    @pytest.mark.asyncio
-    async def test_extract_og_image_handles_invalid_url(self):
-        """Test that invalid URLs return None without error."""
-        url = "https://this-domain-does-not-exist-12345.com/"
-        image = await extract_og_image(url, timeout=5)
-        assert image is None
+class TestFindImage:
+    """Tests for image lookup in fetched HTML."""
+
+    def test_prefers_og_image(self):
+        """Test that og:image wins over twitter:image and body images."""
+        html = (
+            '<html><head><meta name="twitter:image" content="https://x.com/t.jpg">'
+            '<meta property="og:image" content="https://x.com/og.jpg"></head>'
+            '<body><img src="https://x.com/body.jpg"></body></html>'
+        )
+        assert _find_image(html) == "https://x.com/og.jpg"
+
+    def test_falls_back_to_twitter_image(self):
+        """Test that twitter:image is used when og:image is missing."""
+        html = (
+            '<html><head><meta name="twitter:image" content="https://x.com/t.jpg">'
+            "</head><body></body></html>"
+        )
+        assert _find_image(html) == "https://x.com/t.jpg"
+
+    def test_falls_back_to_body_image_skipping_icons(self):
+        """Test that the first non-icon body image is used without meta tags."""
+        html = (
+            "<html><head><title>t</title></HEAD><body>"
+            '<img src="https://x.com/logo.png"><img data-src="https://x.com/photo.jpg">'
+            "</body></html>"
+        )
+        assert _find_image(html) == "https://x.com/photo.jpg"
+
+    def test_returns_none_without_images(self):
+        """Test that None is returned when the page has no images."""
+        assert _find_image("<html><head></head><body><p>text</p></body></html>") is None
 
 
 class TestArticleWithImage:
@@ -70,94 +183,74 @@ class TestArticleWithImage:
         assert article.image_url == "https://example.com/new-image.jpg"
 
 
+@pytest.fixture(scope="module")
+def image_articles() -> list[Article]:
+    """Two articles with images, shared by the tests in this module."""
+    return [
+        Article(
+            title=f"Test Article {i}",
+            url=f"https://example.com/article{i}",
+            content=f"Test content {i}",
+            source="Test Source",
+            image_url=f"https://example.com/image{i}.jpg",
+        )
+        for i in (1, 2)
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_articles() -> list[Article]:
+    """Fifteen numbered articles with images, shared by the tests in this module."""
+    return [
+        Article(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            content=f"Content {i}",
+            source="Test",
+            image_url=f"https://example.com/image{i}.jpg",
+        )
+        for i in range(15)
+    ]
+
+
 class TestReportIncludesImages:
     """Tests for report generation with images."""
 
     @pytest.mark.asyncio
-    async def test_highlight_news_includes_image_markdown(self):
+    async def test_highlight_news_includes_image_markdown(self, image_articles):
         """Test that Highlight News section includes image markdown."""
-        articles = [
-            Article(
-                title="Test Article 1",
-                url="https://example.com/article1",
-                content="Test content 1",
-                source="Test Source",
-                image_url="https://example.com/image1.jpg",
-            ),
-            Article(
-                title="Test Article 2",
-                url="https://example.com/article2",
-                content="Test content 2",
-                source="Test Source",
-                image_url="https://example.com/image2.jpg",
-            ),
-        ]
-
-        # Create a mock report without calling the LLM
-        report = _generate_report_section(articles, highlight_count=10)
+        report = await _generate_report_section(image_articles, highlight_count=10)
 
         # Check that images are included in Highlight News
-        assert "![Test Article 1](https://example.com/image1.jpg)" in report
-        assert "![Test Article 2](https://example.com/image2.jpg)" in report
+        images = {int(i): url for i, url in _ARTICLE_IMAGE_RE.findall(report)}
+        assert images == {
+            1: "https://example.com/image1.jpg",
+            2: "https://example.com/image2.jpg",
+        }
 
-    def test_highlight_articles_have_images(self):
+    @pytest.mark.asyncio
+    async def test_highlight_articles_have_images(self, sample_articles):
         """Test that highlight articles have their images in the report."""
-        articles = [
-            Article(
-                title=f"Article {i}",
-                url=f"https://example.com/article{i}",
-                content=f"Content {i}",
-                source="Test",
-                image_url=f"https://example.com/image{i}.jpg",
-            )
-            for i in range(5)
-        ]
-
-        report = _generate_report_section(articles, highlight_count=5)
+        report = await _generate_report_section(sample_articles[:5], highlight_count=5)
 
         # Every highlight article should have its image
-        for i in range(5):
-            assert f"![Article {i}](https://example.com/image{i}.jpg)" in report, \
-                f"Image for Article {i} not found in report"
+        images = {int(i): url for i, url in _ARTICLE_IMAGE_RE.findall(report)}
+        assert images == {i: f"https://example.com/image{i}.jpg" for i in range(5)}
 
-    def test_related_news_has_no_images(self):
+    @pytest.mark.asyncio
+    async def test_related_news_has_no_images(self, sample_articles):
         """Test that Related News section does not include images."""
-        articles = [
-            Article(
-                title=f"Article {i}",
-                url=f"https://example.com/article{i}",
-                content=f"Content {i}",
-                source="Test",
-                image_url=f"https://example.com/image{i}.jpg",
-            )
-            for i in range(15)
-        ]
-
-        report = _generate_report_section(articles, highlight_count=10)
+        report = await _generate_report_section(sample_articles, highlight_count=10)
 
         # Related news (articles 10-14) should NOT have images
-        for i in range(10, 15):
-            assert f"![Article {i}]" not in report, \
-                f"Image for Article {i} found in Related News (should not be there)"
-
-
-def _generate_report_section(articles: list[Article], highlight_count: int = 10) -> str:
-    """Generate the report sections (without LLM call)."""
-    highlight_articles = articles[:highlight_count]
-    related_articles = articles[highlight_count:]
-
-    report = "## 2. Highlight News\n\n"
-    for i, article in enumerate(highlight_articles, 1):
-        report += f"**2.{i}.** [{article.title}]({article.url})\n\n"
-        if article.image_url:
-            report += f"![{article.title}]({article.image_url})\n\n"
-        report += f"{article.content}\n\n"
-        report += f"*Source: {article.source}*\n\n---\n\n"
-
-    if related_articles:
-        report += "## 3. Related News\n\n"
-        for i, article in enumerate(related_articles, 1):
-            report += f"**3.{i}.** [{article.title}]({article.url})\n\n"
-            report += f"{article.content[:200]}{'...' if len(article.content) > 200 else ''}\n\n"
-
-    return report
+        found = {int(i) for i, _ in _ARTICLE_IMAGE_RE.findall(report)}
+        assert found.isdisjoint(range(10, 15)), \
+            f"Images for Articles {sorted(found & set(range(10, 15)))} found in Related News"
+
+
+async def _generate_report_section(articles: list[Article], highlight_count: int = 10) -> str:
+    """Generate a report with the real template, passing a summary to skip the LLM call."""
+    llm = ClaudeLLM(api_key="test-key")
+    return await llm.generate_report(
+        articles, "Test Report", highlight_count=highlight_count, summary="Summary."
+    )
@@ -0,0 +1,128 @@
+"""Tests for LLM output post-processing and report assembly."""
+
+from datetime import datetime
+
+import pytest
+
+from ai_news_reporter.llm.claude import ClaudeLLM
+from ai_news_reporter.llm.openai_llm import OpenAILLM
+from ai_news_reporter.models.article import Article
+
+
+@pytest.fixture(params=[ClaudeLLM, OpenAILLM], ids=["claude", "openai"])
+def llm(request):
+    """LLM instance with a dummy key (no API calls are made)."""
+    return request.param(api_key="test-key")
+
+
+class TestCleanSummary:
+    """Tests for summary cleanup."""
+
+    def test_drops_headers_titles_images_lists_and_sources(self, llm):
+        """Test that structural lines are removed and the first paragraph is kept."""
+        summary = (
+            "# Weekly AI Report\n"
+            "**Executive Summary**\n"
+            "![img](https://example.com/a.jpg)\n"
+            "1. **Item**: detail\n"
+            "*Source: Example*\n"
+            "AI moved fast this week with [a launch](https://example.com).\n"
+            "\n"
+            "\n"
+            "\n"
+            "Second paragraph."
+        )
+        assert llm._clean_summary(summary) == (
+            "AI moved fast this week with [a launch](https://example.com)."
+        )
+
+    def test_title_match_is_case_insensitive(self, llm):
+        """Test that section titles are skipped regardless of case."""
+        assert llm._clean_summary("key developments\nBody text.") == "Body text."
+
+    def test_source_match_is_case_sensitive(self, llm):
+        """Test that only the exact '*Source:' prefix is skipped."""
+        assert llm._clean_summary("*source: kept") == "*source: kept"
+
+    def test_truncates_long_paragraph_at_sentence(self, llm):
+        """Test that paragraphs over 600 chars are cut at the last full stop."""
+        summary = ("Sentence number one is here. " * 30).strip()
+        cleaned = llm._clean_summary(summary)
+        assert len(cleaned) <= 600
+        assert cleaned.endswith("here.")
+
+    def test_returns_empty_for_only_skipped_lines(self, llm):
+        """Test that an all-boilerplate summary yields an empty string."""
+        assert llm._clean_summary("## Header\n*Source: x*") == ""
+
+
+class TestCleanArticleContent:
+    """Tests for article content cleanup."""
+
+    def test_removes_headers_and_bullets(self, llm):
+        """Test that markdown headers and leading bullets are stripped."""
+        content = "## Title\n* first\n* second\ntext ### inline"
+        assert llm._clean_article_content(content) == "Title\nfirst\nsecond\ntext inline"
+
+
+class TestGenerateReport:
+    """Tests for markdown report assembly."""
+
+    @pytest.mark.asyncio
+    async def test_report_layout(self, llm, monkeypatch):
+        """Test section order, highlight/related split and per-article lines."""
+
+        async def fake_summarize(*args, **kwargs):
+            return "Summary text."
+
+        monkeypatch.setattr(llm, "summarize", fake_summarize)
+        articles = [
+            Article(
+                title="First",
+                url="https://example.com/1",
+                content="## Heading\nBody one",
+                source="Src",
+                image_url="https://example.com/1.jpg",
+                published_at=datetime(2025, 1, 6),
+            ),
+            Article(
+                title="Second",
+                url="https://example.com/2",
+                content="x" * 250,
+                source="Src",
+                published_at=datetime(2025, 1, 7),
+            ),
+        ]
+
+        report = await llm.generate_report(articles, "Weekly", highlight_count=1)
+
+        assert report.startswith(
+            f"# Weekly\n\n*Generated by AI News Reporter using {llm.provider_name}*\n"
+        )
+        assert "## 1. Executive Summary\n\nSummary text.\n\n---\n\n" in report
+        assert (
+            "**2.1.** [First](https://example.com/1)\n\n"
+            "![First](https://example.com/1.jpg)\n\n"
+            "Heading\nBody one\n\n"
+            "*Source: Src* | *Published: 2025-01-06*\n\n---\n\n"
+        ) in report
+        assert report.endswith(
+            "## 3. Related News\n\n"
+            "**3.1.** [Second](https://example.com/2) (2025-01-07)\n\n" + "x" * 200 + "...\n\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_uses_given_summary(self, llm, monkeypatch):
+        """Test that a precomputed summary is used without calling the LLM again."""
+
+        async def fail_summarize(*args, **kwargs):
+            raise AssertionError("summarize should not be called")
+
+        monkeypatch.setattr(llm, "summarize", fail_summarize)
+        articles = [
+            Article(title="First", url="https://example.com/1", content="Body", source="Src")
+        ]
+
+        report = await llm.generate_report(articles, "Weekly", summary="Given summary.")
+
+        assert "## 1. Executive Summary\n\nGiven summary.\n\n" in report
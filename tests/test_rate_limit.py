@@ -0,0 +1,54 @@
+"""Tests for the sliding-window LLM rate limiter."""
+
+import time
+
+import pytest
+
+from ai_news_reporter.core.rate_limit import (
+    DEFAULT_RATE_LIMITS,
+    MODEL_RATE_LIMITS,
+    SlidingWindow,
+    rate_limits_for_model,
+)
+
+
+class TestSlidingWindow:
+    """Tests for SlidingWindow."""
+
+    @pytest.mark.asyncio
+    async def test_waits_when_request_limit_reached(self):
+        """Test that the call after rpm calls waits for the window to slide."""
+        limiter = SlidingWindow(rpm=2, tpm=1_000, window=0.2)
+
+        start = time.monotonic()
+        await limiter.acquire(1)
+        await limiter.acquire(1)
+        assert time.monotonic() - start < 0.1
+
+        await limiter.acquire(1)
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_waits_when_token_limit_reached(self):
+        """Test that calls wait while the token budget is used up."""
+        limiter = SlidingWindow(rpm=100, tpm=100, window=0.2)
+
+        start = time.monotonic()
+        await limiter.acquire(80)
+        await limiter.acquire(30)
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_oversized_call_is_not_blocked_forever(self):
+        """Test that a call above the whole token budget runs on an empty window."""
+        limiter = SlidingWindow(rpm=10, tpm=100, window=0.2)
+
+        start = time.monotonic()
+        await limiter.acquire(500)
+        assert time.monotonic() - start < 0.1
+
+
+def test_rate_limits_for_model():
+    """Test lookup by model prefix with a default for unknown models."""
+    assert rate_limits_for_model("claude-sonnet-4-20250514") == MODEL_RATE_LIMITS["claude-sonnet-4"]
+    assert rate_limits_for_model("unknown-model") == DEFAULT_RATE_LIMITS
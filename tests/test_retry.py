@@ -0,0 +1,68 @@
+"""Tests for retry backoff and adaptive concurrency."""
+
+import httpx
+import pytest
+
+from ai_news_reporter.core.retry import AIMDLimiter, is_retryable, with_backoff
+
+
+def _status_error(status_code: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestWithBackoff:
+    """Tests for with_backoff."""
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_until_success(self):
+        """Test that 429 errors are retried and the limiter backs off."""
+        calls = []
+        limiter = AIMDLimiter(initial=8, max_limit=8)
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _status_error(429, {"Retry-After": "0"})
+            return "ok"
+
+        result = await with_backoff(flaky, base_delay=0, limiter=limiter)
+
+        assert result == "ok"
+        assert len(calls) == 3
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        """Test that non-retryable errors are raised immediately."""
+        calls = []
+
+        async def bad_request():
+            calls.append(1)
+            raise _status_error(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await with_backoff(bad_request, base_delay=0)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test that the last error is raised once attempts run out."""
+        calls = []
+
+        async def overloaded():
+            calls.append(1)
+            raise _status_error(529)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await with_backoff(overloaded, max_attempts=3, base_delay=0)
+        assert len(calls) == 3
+
+
+def test_is_retryable():
+    """Test classification of transient and permanent errors."""
+    assert is_retryable(_status_error(503))
+    assert is_retryable(httpx.ConnectError("refused"))
+    assert not is_retryable(_status_error(404))
+    assert not is_retryable(ValueError("bad"))
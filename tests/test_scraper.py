@@ -0,0 +1,53 @@
+"""Tests for web scraper article extraction."""
+
+from selectolax.lexbor import LexborHTMLParser
+
+from ai_news_reporter.collectors.scraper import WebScraper
+
+SAMPLE_HTML = """
+<html>
+<body>
+  <article>
+    <h2><a href="/news/first">First Story</a></h2>
+    <p>First summary.</p>
+    <time datetime="2025-01-06T10:00:00Z">Jan 6</time>
+    <img data-src="/images/first.jpg">
+  </article>
+  <article>
+    <h2><a href="https://other.example.com/second">Second Story</a></h2>
+  </article>
+  <article>
+    <p>No title here.</p>
+  </article>
+</body>
+</html>
+"""
+
+
+class TestExtractArticles:
+    """Tests for WebScraper._extract_articles."""
+
+    def _extract(self) -> list:
+        tree = LexborHTMLParser(SAMPLE_HTML)
+        return WebScraper()._extract_articles(tree, "https://example.com/blog/", {}, "Example")
+
+    def test_skips_articles_without_title(self):
+        """Test that elements without a title are skipped."""
+        assert [a.title for a in self._extract()] == ["First Story", "Second Story"]
+
+    def test_resolves_relative_urls(self):
+        """Test that relative links and images are resolved against the base URL."""
+        first, second = self._extract()
+        assert str(first.url) == "https://example.com/news/first"
+        assert first.image_url == "https://example.com/images/first.jpg"
+        assert str(second.url) == "https://other.example.com/second"
+
+    def test_extracts_content_and_date(self):
+        """Test that content and published date are extracted."""
+        first, second = self._extract()
+        assert first.content == "First summary."
+        assert first.source == "Example"
+        assert first.published_at is not None
+        assert first.published_at.year == 2025
+        assert second.content == ""
+        assert second.published_at is None
@@ -0,0 +1,81 @@
+"""Tests for report generation and markdown conversion."""
+
+import pytest
+
+from ai_news_reporter.processors.summarizer import Summarizer
+
+MARKDOWN = """# Weekly Report
+
+*Generated by AI News Reporter*
+
+---
+
+**2.1.** [OpenAI ships a model](https://example.com/a)
+
+![OpenAI ships a model](https://example.com/a.jpg)
+
+Details here.
+
+- first item
+"""
+
+
+class TestMarkdownConversion:
+    """Tests for Summarizer markdown conversion."""
+
+    def test_markdown_to_html(self):
+        """Test that headers, links, images and lists are rendered as HTML."""
+        html = Summarizer(llm=None)._markdown_to_html(MARKDOWN)
+
+        assert "<h1>Weekly Report</h1>" in html
+        assert "<em>Generated by AI News Reporter</em>" in html
+        assert (
+            '<strong>2.1.</strong> <a href="https://example.com/a">OpenAI ships a model</a>' in html
+        )
+        assert '<img src="https://example.com/a.jpg" alt="OpenAI ships a model" />' in html
+        assert "<li>first item</li>" in html
+        assert "<hr />" in html
+
+    def test_markdown_to_text(self):
+        """Test that formatting, link targets, images and rules are dropped."""
+        text = Summarizer(llm=None)._markdown_to_text(MARKDOWN)
+
+        assert text == (
+            "Weekly Report\n\n"
+            "Generated by AI News Reporter\n\n"
+            "2.1. OpenAI ships a model\n\n"
+            "Details here.\n\n"
+            "- first item"
+        )
+
+
+class _FakeLLM:
+    """LLM stub returning a fixed summary and report."""
+
+    async def summarize(self, articles, prompt=None, focus=""):
+        return "Summary."
+
+    async def generate_report(self, articles, title, prompt, highlight_count, focus, summary):
+        return MARKDOWN
+
+
+class TestGenerateReport:
+    """Tests for Summarizer.generate_report."""
+
+    @pytest.mark.asyncio
+    async def test_renders_all_formats_by_default(self):
+        """Test that HTML and text are rendered when no formats are given."""
+        report = await Summarizer(_FakeLLM()).generate_report([])
+
+        assert report.content_markdown == MARKDOWN
+        assert "<h1>Weekly Report</h1>" in report.content_html
+        assert report.content_text.startswith("Weekly Report")
+
+    @pytest.mark.asyncio
+    async def test_skips_formats_not_requested(self):
+        """Test that formats that were not requested are left empty."""
+        report = await Summarizer(_FakeLLM()).generate_report([], formats={"markdown"})
+
+        assert report.content_markdown == MARKDOWN
+        assert report.content_html == ""
+        assert report.content_text == ""